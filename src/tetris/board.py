@@ -76,19 +76,14 @@ class Board:
         Returns:
             Number of lines cleared
         """
-        lines_cleared = 0
-        # Check from bottom to top
-        y = self.height - 1
-        while y >= 0:
-            if all(cell is not None for cell in self.grid[y]):
-                # Line is full, remove it
-                del self.grid[y]
-                # Add empty line at top
-                self.grid.insert(0, [None for _ in range(self.width)])
-                lines_cleared += 1
-                # Don't decrement y, check same row again
-            else:
-                y -= 1
+        # A row is full when it holds no None cell; `None in row` is a
+        # single C-level scan, so one pass filters out every full line
+        remaining = [row for row in self.grid if None in row]
+        lines_cleared = self.height - len(remaining)
+        if lines_cleared:
+            self.grid = [
+                [None] * self.width for _ in range(lines_cleared)
+            ] + remaining
         return lines_cleared
 
     def is_game_over(self, spawn_y: int = 0) -> bool:
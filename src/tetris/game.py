@@ -23,9 +23,46 @@ from .constants import (
     SPEED_INCREASE_PER_LEVEL, LINES_PER_LEVEL,
     SCORE_SINGLE_LINE, SCORE_DOUBLE_LINE, SCORE_TRIPLE_LINE, SCORE_QUAD_LINE,
     SCORE_SOFT_DROP, SCORE_HARD_DROP, POWERUP_SPAWN_RATE,
-    GameState, PowerUpType
+    WINDOW_WIDTH, WINDOW_HEIGHT, GameState, PowerUpType
 )
 
+# Notification strings per power-up, hoisted so no dict literal is built
+# (and no enum-to-string fallback runs) on every power-up event
+_POWERUP_GOT = {
+    PowerUpType.BOMB: "Got BOMB!",
+    PowerUpType.MAGNET: "Got MAGNET!",
+    PowerUpType.TIME_FREEZE: "Got FREEZE!",
+    PowerUpType.GRAVITY_REVERSE: "Got REVERSE!",
+    PowerUpType.LINE_ERASER: "Got ERASER!",
+    PowerUpType.GHOST_MODE: "Got GHOST!",
+}
+
+# Score per lines cleared (index = line count, capped at 4)
+_LINE_SCORES = (0, SCORE_SINGLE_LINE, SCORE_DOUBLE_LINE,
+                SCORE_TRIPLE_LINE, SCORE_QUAD_LINE)
+
+# States whose frames only change in response to events (or the input
+# cursor blink); run/run_async skip render() on them while nothing is dirty
+_STATIC_STATES = frozenset((
+    GameState.GAME_OVER,
+    GameState.GAME_OVER_INPUT,
+    GameState.SUBMITTING_SCORE,
+    GameState.LEADERBOARD,
+))
+
+# SDL key repeat (set_repeat in __init__) is global, so only the movement
+# keys are allowed to auto-repeat; every other KEYDOWN is a one-shot action
+_REPEATABLE_KEYS = frozenset((pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN))
+
+_POWERUP_ACTIVATED = {
+    PowerUpType.BOMB: "BOMB Activated!",
+    PowerUpType.MAGNET: "MAGNET Activated!",
+    PowerUpType.TIME_FREEZE: "TIME FREEZE!",
+    PowerUpType.GRAVITY_REVERSE: "GRAVITY REVERSED!",
+    PowerUpType.LINE_ERASER: "LINES CLEARED!",
+    PowerUpType.GHOST_MODE: "GHOST MODE!",
+}
+
 
 class GameEnhanced:
     """Enhanced game controller with power-ups and multiple modes."""
@@ -48,10 +85,37 @@ class GameEnhanced:
         self.renderer = Renderer()
         self.clock = pygame.time.Clock()
 
+        # Precomputed layout geometry: the board size is fixed for the life
+        # of a game, so fold the spawn/render arithmetic into constants here
+        self._spawn_x = self.board.width // 2 - 2
+        # Clamp cell size between 24 and 30 so Crazy mode (22 rows) still fits
+        self._cell_size = min(30, max(24, (WINDOW_HEIGHT - 130) // self.board.height))
+        self.renderer.cell_size = self._cell_size
+        self._offset_x = 40
+        self._offset_y = 50
+        # Score multiplier scaled to an integer (x100) so scoring stays in
+        # pure int arithmetic
+        self._score_mul = int(self.mode_config.score_multiplier * 100)
+        self._board_end_x = self._offset_x + self.board.width * self._cell_size + 10
+
+        # Cached board surface (dirty-flag system): the board is only re-rendered
+        # when its contents change, not every frame
+        self._board_dirty = True
+        self._board_surface: Optional[pygame.Surface] = None
+
         # Touch controls for mobile
         self.touch_controls = TouchControlManager()
         self.enable_touch_controls = True  # Can be toggled for desktop
 
+        # Allow only event types the game actually handles; everything else
+        # is dropped at the SDL layer before a Python event object is built
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+            pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+            pygame.VIDEORESIZE,
+        ])
+
         # Game state
         self.state = GameState.PLAYING
         self.score = 0
@@ -83,20 +147,24 @@ class GameEnhanced:
         self.lock_timer = 0
         self.is_on_ground = False
 
-        # Input handling
-        self.move_delay = 0.15
-        self.last_left_move = 0
-        self.last_right_move = 0
-        self.last_down_move = 0
+        # Input handling: let SDL post repeated KEYDOWN events instead of
+        # polling get_pressed() with hand-rolled repeat timers (150ms DAS,
+        # 50ms repeat); _held_keys tells repeats apart from fresh presses
+        # for the non-movement keys (see _REPEATABLE_KEYS)
+        pygame.key.set_repeat(150, 50)
+        self._held_keys = set()
 
         # Notification system
         self.notification_text = ""
-        self.notification_time = 0
         self.notification_duration = 2.0  # seconds
+        self._notification_expiry = 0.0  # monotonic deadline, set on show
 
         # Exit flag for returning to menu
         self.should_exit_to_menu = False
 
+        # Redraw flag for the static overlay states (see _STATIC_STATES)
+        self._frame_dirty = True
+
         # Leaderboard system
         self.leaderboard_manager = GistLeaderboardManager()
         self.text_input = TextInput(
@@ -111,6 +179,14 @@ class GameEnhanced:
         self._submit_button_rect = None
         self._skip_button_rect = None
         self._input_box_rect = None  # For triggering browser prompt on mobile
+        self._init_overlay_layout()
+        self._prompt_installed = False  # JS prompt function installed on window?
+
+        # Cached overlay panels (built on first draw, blitted thereafter)
+        self._input_overlay_bg: Optional[pygame.Surface] = None
+        self._submitting_overlay_bg: Optional[pygame.Surface] = None
+        self._ok_button_surf: Optional[pygame.Surface] = None
+        self._skip_button_surf: Optional[pygame.Surface] = None
 
         # Spawn first blocks
         self.spawn_new_block()
@@ -146,7 +222,7 @@ class GameEnhanced:
         )
 
         # Set spawn position (centered at top)
-        self.current_block.x = self.board.width // 2 - 2
+        self.current_block.x = self._spawn_x
         self.current_block.y = 0
 
         # Check if spawn position is valid (game over if not)
@@ -154,6 +230,8 @@ class GameEnhanced:
         if not self.powerup_manager.is_effect_active(PowerUpType.GHOST_MODE):
             if not self.board.is_valid_position(self.current_block):
                 self.state = GameState.GAME_OVER
+                # Entering a static state: force one redraw for the overlay
+                self._frame_dirty = True
 
         self.can_hold = True
         self.is_on_ground = False
@@ -184,6 +262,7 @@ class GameEnhanced:
             else:
                 # Still out of bounds, revert
                 self.current_block.move(-dx, -dy)
+                self._ground_on_failed_drop(dx, dy)
                 return False
 
         if self.board.is_valid_position(self.current_block):
@@ -194,8 +273,21 @@ class GameEnhanced:
         else:
             # Revert move
             self.current_block.move(-dx, -dy)
+            self._ground_on_failed_drop(dx, dy)
             return False
 
+    def _ground_on_failed_drop(self, dx: int, dy: int) -> None:
+        """Ground the piece when a pure downward move is blocked.
+
+        A failed soft drop means the piece just landed; start the lock
+        delay now instead of waiting up to a full gravity tick for the
+        next fall attempt to notice. Already-grounded pieces keep their
+        running timer so holding DOWN cannot stall the lock forever.
+        """
+        if dy > 0 and dx == 0 and not self.is_on_ground:
+            self.is_on_ground = True
+            self.lock_timer = time.time()
+
     def _check_ground_after_move(self) -> None:
         """Check if block is still on ground after horizontal move.
 
@@ -236,10 +328,12 @@ class GameEnhanced:
         # Ghost mode ignores collisions but checks bounds
         if self.powerup_manager.is_effect_active(PowerUpType.GHOST_MODE):
             if self.board.is_within_bounds(self.current_block):
+                self._check_ground_after_move()
                 return True
             # Out of bounds, try wall kicks
 
         if self.board.is_valid_position(self.current_block):
+            self._check_ground_after_move()
             return True
 
         # Try wall kicks
@@ -247,6 +341,7 @@ class GameEnhanced:
         for dx, dy in wall_kicks:
             self.current_block.move(dx, dy)
             if self.board.is_valid_position(self.current_block):
+                self._check_ground_after_move()
                 return True
             self.current_block.move(-dx, -dy)
 
@@ -255,13 +350,26 @@ class GameEnhanced:
         return False
 
     def hard_drop(self) -> int:
-        """Drop block instantly to bottom."""
+        """Drop block instantly to bottom.
+
+        Computes the landing row in a single pass rather than moving the
+        block one row at a time, keeping the frame short (under pygbag the
+        browser only gets control back between frames, so long per-frame
+        work shows up as input lag).
+        """
         if not self.current_block:
             return 0
 
-        rows_dropped = 0
-        while self.move_block(0, 1):
-            rows_dropped += 1
+        if self.powerup_manager.is_effect_active(PowerUpType.GHOST_MODE):
+            # Ghost mode phases through blocks, so fall row by row until
+            # the bottom boundary stops the block
+            rows_dropped = 0
+            while self.move_block(0, 1):
+                rows_dropped += 1
+        else:
+            target_y = self.board.get_drop_position(self.current_block)
+            rows_dropped = max(0, target_y - self.current_block.y)
+            self.current_block.y = target_y
 
         self.lock_block()
         return rows_dropped
@@ -280,12 +388,7 @@ class GameEnhanced:
             powerup_type = get_random_powerup()
             success = self.powerup_manager.add_powerup(powerup_type)
             if success:
-                name_map = {
-                    "bomb": "BOMB", "rainbow": "RAINBOW", "time_freeze": "FREEZE",
-                    "gravity_reverse": "REVERSE", "line_eraser": "ERASER", "ghost_mode": "GHOST"
-                }
-                name = name_map.get(powerup_type.value, powerup_type.value.upper())
-                self.show_notification(f"Got {name}!")
+                self.show_notification(_POWERUP_GOT[powerup_type])
             else:
                 self.show_notification("Inventory Full!")
             self.is_powerup_block = False
@@ -295,14 +398,13 @@ class GameEnhanced:
 
         self.board.place_block(self.current_block)
         lines = self.board.clear_lines()
+        self._board_dirty = True
 
         # Update score
         if lines > 0:
             self.lines_cleared += lines
-            line_score = [0, SCORE_SINGLE_LINE, SCORE_DOUBLE_LINE,
-                         SCORE_TRIPLE_LINE, SCORE_QUAD_LINE][min(lines, 4)]
-            multiplier = self.mode_config.score_multiplier
-            self.score += int(line_score * self.level * multiplier)
+            line_score = _LINE_SCORES[min(lines, 4)]
+            self.score += (line_score * self.level * self._score_mul) // 100
 
             # Level up
             new_level = (self.lines_cleared // LINES_PER_LEVEL) + 1
@@ -320,14 +422,31 @@ class GameEnhanced:
             if self.leaderboard_manager.online_mode:
                 self.state = GameState.GAME_OVER_INPUT
                 self.text_input.active = True  # Auto-activate input
+                self._prefetch_leaderboard()
             else:
                 self.state = GameState.GAME_OVER
+            # Entering a static state: force one redraw so the final locked
+            # piece and the overlay appear without waiting for an event
+            self._frame_dirty = True
 
             if self.score > self.high_score:
                 self.high_score = self.score
         else:
             self.spawn_new_block()
 
+    def _prefetch_leaderboard(self) -> None:
+        """Start fetching the leaderboard in the background (async loop only).
+
+        Called when entering GAME_OVER_INPUT so the network round trip
+        overlaps with the player typing their ID; by submit time the fetch
+        is usually already cached.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Sync loop (desktop run()), no background fetch
+        loop.create_task(self.leaderboard_manager.fetch_leaderboard_async())
+
     def show_notification(self, text: str) -> None:
         """Show a notification message.
 
@@ -335,7 +454,7 @@ class GameEnhanced:
             text: Message to display
         """
         self.notification_text = text
-        self.notification_time = time.time()
+        self._notification_expiry = time.monotonic() + self.notification_duration
 
     def use_powerup(self) -> None:
         """Activate a power-up from inventory."""
@@ -344,13 +463,7 @@ class GameEnhanced:
             return
 
         # Show activation message
-        name_map = {
-            "bomb": "BOMB Activated!", "rainbow": "RAINBOW Activated!",
-            "time_freeze": "TIME FREEZE!", "gravity_reverse": "GRAVITY REVERSED!",
-            "line_eraser": "LINES CLEARED!", "ghost_mode": "GHOST MODE!"
-        }
-        msg = name_map.get(powerup.type.value, "Power-up activated!")
-        self.show_notification(msg)
+        self.show_notification(_POWERUP_ACTIVATED[powerup.type])
 
         # Apply instant effects
         if powerup.type == PowerUpType.BOMB:
@@ -361,13 +474,25 @@ class GameEnhanced:
                 self.show_notification(f"BOOM! Cleared {cleared} blocks!")
             else:
                 self.show_notification("No problematic areas to bomb!")
+            self._board_dirty = True
 
         elif powerup.type == PowerUpType.LINE_ERASER:
             self.board.clear_bottom_rows(2)
+            self._board_dirty = True
 
         elif powerup.type == PowerUpType.MAGNET:
             # Drop all floating blocks down (gravity compress)
             self.board.apply_gravity_compress()
+            self._board_dirty = True
+
+        # Board-mutating effects change the surface under the current piece
+        # (and ghost mode changes the collision rule entirely); re-arm the
+        # lock delay so the piece settles against the new rules instead of
+        # locking mid-air where the old surface was
+        if powerup.type in (PowerUpType.BOMB, PowerUpType.LINE_ERASER,
+                            PowerUpType.MAGNET, PowerUpType.GHOST_MODE):
+            self.is_on_ground = False
+            self.lock_timer = 0
 
     def hold_current_block(self) -> None:
         """Hold current block and swap with held block."""
@@ -382,17 +507,25 @@ class GameEnhanced:
             self.next_block = self.generate_block()
 
         # Reset position
-        self.current_block.x = self.board.width // 2 - 2
+        self.current_block.x = self._spawn_x
         self.current_block.y = 0
         self.current_block.rotation = 0
 
+        # The swapped-in piece starts fresh at spawn; clear any grounded
+        # state carried over from the old piece or it can lock mid-air
+        self.is_on_ground = False
+        self.lock_timer = 0
+
         self.can_hold = False
 
     def update(self, dt: float) -> None:
         """Update game state."""
         # Update text input cursor animation during input state
         if self.state == GameState.GAME_OVER_INPUT:
+            was_visible = self.text_input.cursor_visible
             self.text_input.update(dt)
+            if self.text_input.cursor_visible != was_visible:
+                self._frame_dirty = True
             return
 
         if self.state != GameState.PLAYING:
@@ -406,17 +539,6 @@ class GameEnhanced:
 
         current_time = time.time()
 
-        # Check if block is on ground
-        test_block = self.current_block.copy()
-        test_block.y += 1
-
-        # Ghost mode: check if at bottom boundary (can stop there)
-        if self.powerup_manager.is_effect_active(PowerUpType.GHOST_MODE):
-            # Can phase through blocks, but stops at bottom or if can't move down
-            self.is_on_ground = not self.board.is_within_bounds(test_block)
-        else:
-            self.is_on_ground = not self.board.is_valid_position(test_block)
-
         # Time freeze stops falling
         if self.powerup_manager.is_effect_active(PowerUpType.TIME_FREEZE):
             return
@@ -428,13 +550,17 @@ class GameEnhanced:
         else:
             dy = 1
 
+        # The gravity move doubles as the ground probe: a failed downward move
+        # means the block is grounded, so no separate per-frame collision test
+        # is needed (move_block already handles ghost mode bounds checks)
         if current_time - self.last_fall_time >= self.fall_speed:
-            if not self.move_block(0, dy):
-                if not self.is_on_ground:
-                    self.is_on_ground = True
-                    self.lock_timer = current_time
-            else:
+            if self.move_block(0, dy):
                 self.is_on_ground = False
+            elif dy > 0 and not self.is_on_ground:
+                # Only downward gravity grounds a block; a block stuck at the
+                # top during gravity reverse just waits for the effect to end
+                self.is_on_ground = True
+                self.lock_timer = current_time
 
             self.last_fall_time = current_time
 
@@ -445,37 +571,6 @@ class GameEnhanced:
             elif current_time - self.lock_timer >= LOCK_DELAY:
                 self.lock_block()
 
-    def handle_input(self) -> None:
-        """Handle keyboard input."""
-        if self.state != GameState.PLAYING:
-            return
-
-        current_time = time.time()
-        keys = pygame.key.get_pressed()
-
-        # Left movement
-        if keys[pygame.K_LEFT]:
-            if current_time - self.last_left_move >= self.move_delay:
-                if self.move_block(-1, 0):
-                    self.last_left_move = current_time
-                    if self.is_on_ground:
-                        self.lock_timer = current_time
-
-        # Right movement
-        if keys[pygame.K_RIGHT]:
-            if current_time - self.last_right_move >= self.move_delay:
-                if self.move_block(1, 0):
-                    self.last_right_move = current_time
-                    if self.is_on_ground:
-                        self.lock_timer = current_time
-
-        # Soft drop
-        if keys[pygame.K_DOWN]:
-            if current_time - self.last_down_move >= 0.05:
-                if self.soft_drop():
-                    self.score += SCORE_SOFT_DROP
-                    self.last_down_move = current_time
-
     def _show_browser_prompt(self) -> Optional[str]:
         """Show browser prompt dialog for text input (Web only).
 
@@ -488,15 +583,20 @@ class GameEnhanced:
         try:
             from platform import window
 
+            # Install the prompt function on window once; later calls invoke
+            # it directly instead of re-parsing the JS snippet every tap
+            if not self._prompt_installed:
+                window.eval(
+                    'window._tetris_prompt_fn = function() {'
+                    ' var result = prompt("Enter your Player ID (max 12 chars):", "");'
+                    ' if (result === null) return "";'
+                    ' return result.slice(0, 12);'
+                    '};'
+                )
+                self._prompt_installed = True
+
             # Use browser's native prompt - this will show mobile keyboard
-            js_code = '''
-            (function() {
-                var result = prompt("Enter your Player ID (max 12 chars):", "");
-                if (result === null) return "";
-                return result.slice(0, 12);
-            })()
-            '''
-            result = window.eval(js_code)
+            result = window._tetris_prompt_fn()
             return result if result else None
         except Exception as e:
             print(f"Error showing prompt: {e}")
@@ -504,6 +604,12 @@ class GameEnhanced:
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events (keyboard + touch)."""
+        # Any event may change what is on screen
+        self._frame_dirty = True
+
+        if event.type == pygame.KEYUP:
+            self._held_keys.discard(event.key)
+
         # Handle text input during game over input state
         if self.state == GameState.GAME_OVER_INPUT:
             # Mobile: Handle button clicks
@@ -622,8 +728,25 @@ class GameEnhanced:
 
         # Handle keyboard events (keep for desktop compatibility)
         if event.type == pygame.KEYDOWN:
+            # Suppress SDL auto-repeat for one-shot actions: a held SPACE
+            # must not hard-drop the next piece too
+            if event.key in self._held_keys:
+                if event.key not in _REPEATABLE_KEYS:
+                    return
+            else:
+                self._held_keys.add(event.key)
+
             if self.state == GameState.PLAYING:
-                if event.key == pygame.K_UP:
+                if event.key == pygame.K_LEFT:
+                    if self.move_block(-1, 0) and self.is_on_ground:
+                        self.lock_timer = time.time()
+                elif event.key == pygame.K_RIGHT:
+                    if self.move_block(1, 0) and self.is_on_ground:
+                        self.lock_timer = time.time()
+                elif event.key == pygame.K_DOWN:
+                    if self.soft_drop():
+                        self.score += SCORE_SOFT_DROP
+                elif event.key == pygame.K_UP:
                     self.rotate_block(clockwise=True)
                     if self.is_on_ground:
                         self.lock_timer = time.time()
@@ -655,24 +778,20 @@ class GameEnhanced:
         """Render current game state."""
         self.renderer.clear_screen()
 
-        # Calculate dynamic cell size based on board height
-        # Maximum board height that fits: (750 - 50 offset - 80 button area) / cell_size
-        # For Crazy mode (22 rows): need smaller cells
-        from .constants import CELL_SIZE, WINDOW_HEIGHT
-        max_board_height = WINDOW_HEIGHT - 130  # Leave space for title and buttons
-        ideal_cell_size = max_board_height // self.board.height
-        # Clamp between 24 and 30
-        self.renderer.cell_size = min(30, max(24, ideal_cell_size))
-
-        # Adjusted offsets for larger board
-        offset_x = 40
-        offset_y = 50
-
-        # Calculate board end position for dynamic UI layout
-        board_end_x = offset_x + self.board.width * self.renderer.cell_size + 10  # 10px padding
-
-        # Draw board and blocks
-        self.renderer.draw_board(self.board, offset_x, offset_y)
+        # Layout geometry is precomputed in __init__ (board size never
+        # changes mid-game)
+        offset_x = self._offset_x
+        offset_y = self._offset_y
+        board_end_x = self._board_end_x
+
+        # Draw board from the cached surface; rebuild it only when dirty
+        if self._board_surface is None:
+            self._board_surface = self.renderer.create_board_surface(self.board)
+            self._board_dirty = True
+        if self._board_dirty:
+            self.renderer.render_board_to_surface(self.board, self._board_surface)
+            self._board_dirty = False
+        self.renderer.screen.blit(self._board_surface, (offset_x - 5, offset_y - 5))
 
         if self.current_block:
             self.renderer.draw_ghost_piece(self.current_block, self.board, offset_x, offset_y)
@@ -700,9 +819,13 @@ class GameEnhanced:
                 board_end_x=board_end_x
             )
 
-        # Draw notification if active
-        if self.notification_text and time.time() - self.notification_time < self.notification_duration:
-            self.renderer.draw_notification(self.notification_text)
+        # Draw notification if active; clear once expired so the common
+        # no-notification path is just a string truthiness check
+        if self.notification_text:
+            if time.monotonic() >= self._notification_expiry:
+                self.notification_text = ""
+            else:
+                self.renderer.draw_notification(self.notification_text)
 
         # Draw touch controls
         if self.enable_touch_controls:
@@ -746,6 +869,7 @@ class GameEnhanced:
     def restart(self) -> None:
         """Restart the game."""
         self.board.clear()
+        self._board_dirty = True
         self.score = 0
         self.level = 1
         self.lines_cleared = 0
@@ -783,22 +907,33 @@ class GameEnhanced:
             mode=self.mode.value  # "casual", "classic", or "crazy"
         )
 
-        # Submit to cloud (async)
-        success, message = await self.leaderboard_manager.submit_score_async(entry)
+        # Paint one more "Submitting..." frame, then submit and only fetch
+        # once the submit has resolved: submit_score_async invalidates the
+        # cached leaderboard, so a concurrent fetch races the in-flight POST
+        # and can return rankings that miss the player's own score.
+        self.render()
+        await asyncio.sleep(0)
+        success, message = await self.leaderboard_manager.submit_score_async(
+            entry)
+        # One round trip for both the rankings and the player's own rank
+        self.leaderboard_entries, rank = (
+            await self.leaderboard_manager.get_snapshot_async(
+                mode=self.mode.value,
+                score=self.score,
+                limit=10
+            ))
 
         if success:
-            self.show_notification(message)
+            if rank:
+                self.show_notification(f"{message} Rank #{rank}")
+            else:
+                self.show_notification(message)
         else:
             self.show_notification(f"Upload failed: {message}")
 
-        # Fetch and show leaderboard (even if upload failed) - async
-        self.leaderboard_entries = await self.leaderboard_manager.get_leaderboard_async(
-            mode=self.mode.value,
-            limit=10
-        )
-
         # Switch to leaderboard view
         self.state = GameState.LEADERBOARD
+        self._frame_dirty = True
 
     def _submit_score_to_leaderboard(self, player_id: str) -> None:
         """Submit score to leaderboard (sync fallback for desktop).
@@ -820,170 +955,199 @@ class GameEnhanced:
         # Submit to cloud
         success, message = self.leaderboard_manager.submit_score(entry)
 
-        if success:
-            self.show_notification(message)
-        else:
-            self.show_notification(f"Upload failed: {message}")
-
         # Fetch and show leaderboard
         self.leaderboard_entries = self.leaderboard_manager.get_leaderboard(
             mode=self.mode.value,
             limit=10
         )
 
+        if success:
+            rank = self.leaderboard_manager.get_player_rank(
+                self.mode.value, self.score)
+            if rank:
+                self.show_notification(f"{message} Rank #{rank}")
+            else:
+                self.show_notification(message)
+        else:
+            self.show_notification(f"Upload failed: {message}")
+
         # Switch to leaderboard view
         self.state = GameState.LEADERBOARD
+        self._frame_dirty = True
 
-    def _draw_input_overlay(self) -> None:
-        """Draw player ID input overlay on top of game over screen."""
-        # Small overlay panel
+    def _build_overlay_panel(self, width: int, height: int) -> pygame.Surface:
+        """Build a semi-transparent white overlay panel with border.
+
+        Uses a per-pixel-alpha surface with convert_alpha() so the blit
+        goes through SDL's fast alpha-blend path instead of the slow
+        per-surface-alpha path.
+        """
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((255, 255, 255, 240))
+        pygame.draw.rect(panel, (100, 100, 100), panel.get_rect(), 3, border_radius=15)
+        return panel.convert_alpha()
+
+    def _build_button_surf(self, label: str, fill: tuple, border: tuple,
+                           width: int, height: int) -> pygame.Surface:
+        """Pre-render a rounded button with its label baked in."""
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        rect = surf.get_rect()
+        pygame.draw.rect(surf, fill, rect, border_radius=10)
+        pygame.draw.rect(surf, border, rect, 3, border_radius=10)
+        text = self.renderer.font_small.render(label, True, (255, 255, 255))
+        surf.blit(text, text.get_rect(center=rect.center))
+        return surf.convert_alpha()
+
+    def _init_overlay_layout(self) -> None:
+        """Precompute the fixed rects for the input/submitting overlays.
+
+        The panels sit at hard-coded positions in a fixed-size window, so
+        the layout never changes; computing it once avoids re-deriving the
+        geometry (and copying rects) every frame the overlay is visible.
+        """
         panel_width = 400
         panel_height = 250 if IS_WEB else 200
-        panel_x = (800 - panel_width) // 2  # WINDOW_WIDTH = 800
+        panel_x = (WINDOW_WIDTH - panel_width) // 2
         panel_y = 250
-
-        # Semi-transparent background
-        overlay = pygame.Surface((panel_width, panel_height))
-        overlay.set_alpha(240)
-        overlay.fill((255, 255, 255))
-        self.renderer.screen.blit(overlay, (panel_x, panel_y))
-
-        # Border
-        pygame.draw.rect(
-            self.renderer.screen,
-            (100, 100, 100),
-            pygame.Rect(panel_x, panel_y, panel_width, panel_height),
-            3,
-            border_radius=15
-        )
-
-        # Prompt text
-        self.renderer.draw_text(
-            "Enter Your Player ID:",
-            panel_x + panel_width // 2,
-            panel_y + 40,
-            self.renderer.font_small,
-            (80, 70, 90),
-            center=True
-        )
+        self._input_panel_size = (panel_width, panel_height)
+        self._input_panel_pos = (panel_x, panel_y)
 
         # Text input box (clickable on mobile to trigger prompt)
         self.text_input.rect.centerx = panel_x + panel_width // 2
         self.text_input.rect.y = panel_y + 80
         self._input_box_rect = self.text_input.rect.copy()
+
+        # Mobile OK / SKIP buttons
+        button_width = 120
+        button_height = 50
+        self._overlay_button_size = (button_width, button_height)
+        button_y = panel_y + 150
+        gap = 20
+        ok_x = panel_x + panel_width // 2 - button_width - gap // 2
+        skip_x = panel_x + panel_width // 2 + gap // 2
+        self._submit_button_rect = pygame.Rect(ok_x, button_y, button_width, button_height)
+        self._skip_button_rect = pygame.Rect(skip_x, button_y, button_width, button_height)
+
+        self._submitting_panel_size = (300, 100)
+        self._submitting_panel_pos = ((WINDOW_WIDTH - 300) // 2, 300)
+
+    def _draw_input_overlay(self) -> None:
+        """Draw player ID input overlay on top of game over screen."""
+        panel_width, panel_height = self._input_panel_size
+
+        # Static panel (background, border, prompt, desktop hint) is built
+        # once and blitted; only the text input redraws per frame
+        if self._input_overlay_bg is None:
+            panel = self._build_overlay_panel(panel_width, panel_height)
+            prompt = self.renderer.font_small.render(
+                "Enter Your Player ID:", True, (80, 70, 90))
+            panel.blit(prompt, prompt.get_rect(center=(panel_width // 2, 40)))
+            if not IS_WEB:
+                hint = self.renderer.font_small.render(
+                    "Press ENTER to submit", True, (150, 150, 150))
+                panel.blit(hint, hint.get_rect(center=(panel_width // 2, 150)))
+            self._input_overlay_bg = panel
+        self.renderer.screen.blit(self._input_overlay_bg, self._input_panel_pos)
+
         self.text_input.draw(self.renderer.screen, placeholder="Tap to enter name" if IS_WEB else "Your Name")
 
         if IS_WEB:
-            # Mobile: Show OK and SKIP buttons
-            button_width = 120
-            button_height = 50
-            button_y = panel_y + 150
-            gap = 20
-
-            # OK button (green)
-            ok_x = panel_x + panel_width // 2 - button_width - gap // 2
-            self._submit_button_rect = pygame.Rect(ok_x, button_y, button_width, button_height)
-            pygame.draw.rect(self.renderer.screen, (76, 175, 80), self._submit_button_rect, border_radius=10)
-            pygame.draw.rect(self.renderer.screen, (56, 142, 60), self._submit_button_rect, 3, border_radius=10)
-            self.renderer.draw_text(
-                "OK",
-                ok_x + button_width // 2,
-                button_y + button_height // 2,
-                self.renderer.font_small,
-                (255, 255, 255),
-                center=True
-            )
-
-            # SKIP button (gray)
-            skip_x = panel_x + panel_width // 2 + gap // 2
-            self._skip_button_rect = pygame.Rect(skip_x, button_y, button_width, button_height)
-            pygame.draw.rect(self.renderer.screen, (158, 158, 158), self._skip_button_rect, border_radius=10)
-            pygame.draw.rect(self.renderer.screen, (117, 117, 117), self._skip_button_rect, 3, border_radius=10)
-            self.renderer.draw_text(
-                "SKIP",
-                skip_x + button_width // 2,
-                button_y + button_height // 2,
-                self.renderer.font_small,
-                (255, 255, 255),
-                center=True
-            )
-        else:
-            # Desktop: Hint text
-            self.renderer.draw_text(
-                "Press ENTER to submit",
-                panel_x + panel_width // 2,
-                panel_y + 150,
-                self.renderer.font_small,
-                (150, 150, 150),
-                center=True
+            # Mobile: OK and SKIP buttons, pre-rendered with their labels
+            # baked in and drawn with one batched blit call
+            if self._ok_button_surf is None:
+                button_width, button_height = self._overlay_button_size
+                self._ok_button_surf = self._build_button_surf(
+                    "OK", (76, 175, 80), (56, 142, 60), button_width, button_height)
+                self._skip_button_surf = self._build_button_surf(
+                    "SKIP", (158, 158, 158), (117, 117, 117), button_width, button_height)
+
+            self.renderer.screen.blits(
+                ((self._ok_button_surf, self._submit_button_rect.topleft),
+                 (self._skip_button_surf, self._skip_button_rect.topleft)),
+                doreturn=0,
             )
 
     def _draw_submitting_overlay(self) -> None:
         """Draw 'Submitting...' overlay during score upload."""
-        # Small overlay panel
-        panel_width = 300
-        panel_height = 100
-        panel_x = (800 - panel_width) // 2
-        panel_y = 300
-
-        # Semi-transparent background
-        overlay = pygame.Surface((panel_width, panel_height))
-        overlay.set_alpha(240)
-        overlay.fill((255, 255, 255))
-        self.renderer.screen.blit(overlay, (panel_x, panel_y))
-
-        # Border
-        pygame.draw.rect(
-            self.renderer.screen,
-            (100, 100, 100),
-            pygame.Rect(panel_x, panel_y, panel_width, panel_height),
-            3,
-            border_radius=15
-        )
-
-        # Submitting text
-        self.renderer.draw_text(
-            "Submitting score...",
-            panel_x + panel_width // 2,
-            panel_y + 50,
-            self.renderer.font_small,
-            (80, 70, 90),
-            center=True
-        )
+        # Small overlay panel, fully static: built once, blitted per frame
+        if self._submitting_overlay_bg is None:
+            panel_width, panel_height = self._submitting_panel_size
+            panel = self._build_overlay_panel(panel_width, panel_height)
+            text = self.renderer.font_small.render(
+                "Submitting score...", True, (80, 70, 90))
+            panel.blit(text, text.get_rect(center=(panel_width // 2, 50)))
+            self._submitting_overlay_bg = panel
+        self.renderer.screen.blit(self._submitting_overlay_bg, self._submitting_panel_pos)
 
     def run(self) -> None:
         """Main game loop (synchronous version for desktop)."""
+        # Local bindings for the per-frame hot loop
+        get_events = pygame.event.get
+        QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+        MOUSEMOTION = pygame.MOUSEMOTION
+        clock_tick = self.clock.tick
+        handle_event = self.handle_event
+        update = self.update
+        render = self.render
+
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = clock_tick(FPS) / 1000.0
 
             # Check if should exit to menu
             if self.should_exit_to_menu:
                 running = False
                 break
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            # Coalesce mouse motion: only the latest position matters, so
+            # process one motion (and one move_block) per frame instead of N
+            motion_events = get_events(MOUSEMOTION)
+            if motion_events:
+                handle_event(motion_events[-1])
+
+            for event in get_events():
+                if event.type == QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
+                elif event.type == KEYDOWN:
                     if event.key == pygame.K_ESCAPE and self.state == GameState.GAME_OVER:
                         running = False
                     else:
-                        self.handle_event(event)
+                        handle_event(event)
                 else:
-                    self.handle_event(event)
+                    handle_event(event)
 
-            self.handle_input()
-            self.update(dt)
-            self.render()
+            update(dt)
+            # Static overlay states: skip the full-screen redraw when no
+            # event, cursor blink, or live notification changed anything
+            if (self._frame_dirty or self.notification_text
+                    or self.state not in _STATIC_STATES):
+                render()
+                self._frame_dirty = False
 
         self.renderer.quit()
 
     async def run_async(self) -> None:
         """Main game loop (async version for web/Pygbag)."""
+        # Local bindings for the per-frame hot loop
+        get_events = pygame.event.get
+        QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+        MOUSEMOTION = pygame.MOUSEMOTION
+        handle_event = self.handle_event
+        update = self.update
+        render = self.render
+
+        # Pace with asyncio.sleep instead of clock.tick: tick busy-waits,
+        # which starves the browser main thread under Pygbag, while an
+        # awaited sleep hands the remaining frame budget back to the loop
+        perf = time.perf_counter
+        target_dt = 1.0 / FPS
+        last_frame = perf()
+
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_start = perf()
+            dt = frame_start - last_frame
+            last_frame = frame_start
 
             # Check if should exit to menu
             if self.should_exit_to_menu:
@@ -996,22 +1160,33 @@ class GameEnhanced:
                 self._pending_submit_player_id = None
                 await self._submit_score_to_leaderboard_async(player_id)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            # Coalesce mouse motion: only the latest position matters, so
+            # process one motion (and one move_block) per frame instead of N
+            motion_events = get_events(MOUSEMOTION)
+            if motion_events:
+                handle_event(motion_events[-1])
+
+            for event in get_events():
+                if event.type == QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
+                elif event.type == KEYDOWN:
                     if event.key == pygame.K_ESCAPE and self.state == GameState.GAME_OVER:
                         running = False
                     else:
-                        self.handle_event(event)
+                        handle_event(event)
                 else:
-                    self.handle_event(event)
-
-            self.handle_input()
-            self.update(dt)
-            self.render()
-
-            # Yield control to event loop (critical for Pygbag)
-            await asyncio.sleep(0)
+                    handle_event(event)
+
+            update(dt)
+            # Static overlay states: skip the full-screen redraw when no
+            # event, cursor blink, or live notification changed anything
+            if (self._frame_dirty or self.notification_text
+                    or self.state not in _STATIC_STATES):
+                render()
+                self._frame_dirty = False
+
+            # Sleep off the rest of the frame budget; also yields control
+            # to the event loop (critical for Pygbag)
+            await asyncio.sleep(max(0.0, target_dt - (perf() - frame_start)))
 
         self.renderer.quit()
@@ -1,12 +1,44 @@
 """Leaderboard manager using Cloudflare Worker proxy for secure API access."""
 
+import asyncio
+import bisect
+import gzip
+import heapq
 import json
 import time
+from operator import attrgetter
 import os
 import sys
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+# Prefer orjson for JSON decode/encode when installed (2-5x faster than
+# stdlib json); fall back silently since it is an optional dependency.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+# C-implemented sort key; cheaper than a lambda per comparison
+_score_key = attrgetter('score')
+
+# requests is desktop-only (not bundled in the pygbag build), so import it
+# once here instead of inside every network method
+try:
+    import requests
+    _REQUESTS_OK = True
+except ImportError:
+    requests = None
+    _REQUESTS_OK = False
+
 # Default Worker URL (can be overridden via environment variable)
 DEFAULT_WORKER_URL = 'https://tetris-leaderboard.jefferysung860629.workers.dev'
 
@@ -17,6 +49,9 @@ IS_WEB = sys.platform == "emscripten"
 class LeaderboardEntry:
     """Single leaderboard entry."""
 
+    __slots__ = ('player_id', 'score', 'lines', 'level', 'mode',
+                 'timestamp', '_date_cache', '_submit_payload')
+
     def __init__(self, player_id: str, score: int, lines: int, level: int,
                  mode: str, timestamp: float = None):
         """Initialize leaderboard entry.
@@ -35,9 +70,23 @@ class LeaderboardEntry:
         self.level = level
         self.mode = mode
         self.timestamp = timestamp or time.time()
+        self._date_cache: Optional[str] = None  # formatted lazily in to_dict
+        # Entries are immutable in practice; build the Worker submit
+        # payload once so retries reuse it
+        self._submit_payload = {
+            'player_id': player_id,
+            'score': score,
+            'lines': lines,
+            'level': level,
+            'mode': mode
+        }
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
+        # The timestamp never changes, so format the date string once
+        if self._date_cache is None:
+            self._date_cache = datetime.fromtimestamp(
+                self.timestamp).strftime('%Y-%m-%d %H:%M')
         return {
             'player_id': self.player_id,
             'score': self.score,
@@ -45,20 +94,34 @@ class LeaderboardEntry:
             'level': self.level,
             'mode': self.mode,
             'timestamp': self.timestamp,
-            'date': datetime.fromtimestamp(self.timestamp).strftime('%Y-%m-%d %H:%M')
+            'date': self._date_cache
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'LeaderboardEntry':
-        """Create entry from dictionary."""
-        return cls(
-            player_id=data['player_id'],
-            score=data['score'],
-            lines=data['lines'],
-            level=data.get('level', 1),
-            mode=data['mode'],
-            timestamp=data['timestamp']
-        )
+        """Create entry from dictionary.
+
+        Bypasses __init__ and assigns slots directly: parsing a fetched
+        leaderboard builds up to 100 entries per mode, and skipping the
+        kwargs dispatch (plus the timestamp default branch) is measurably
+        cheaper at that volume.
+        """
+        obj = cls.__new__(cls)
+        obj.player_id = player_id = data['player_id']
+        obj.score = score = data['score']
+        obj.lines = lines = data['lines']
+        obj.level = level = data.get('level', 1)
+        obj.mode = mode = data['mode']
+        obj.timestamp = data['timestamp']
+        obj._date_cache = None
+        obj._submit_payload = {
+            'player_id': player_id,
+            'score': score,
+            'lines': lines,
+            'level': level,
+            'mode': mode
+        }
+        return obj
 
 
 class GistLeaderboardManager:
@@ -72,59 +135,175 @@ class GistLeaderboardManager:
         """
         self.worker_url = worker_url or os.environ.get('WORKER_URL', DEFAULT_WORKER_URL)
 
-        # Cache
+        # Cache for raw fetch results. Timestamps use time.monotonic() so
+        # a wall-clock adjustment can neither pin the cache forever nor
+        # expire it early. The TTL adapts to the observed update rate in
+        # _store_cache; 30s is just the starting point.
         self._cache: Optional[Dict] = None
         self._cache_time: float = 0
-        self._cache_duration: float = 30.0  # 30 seconds cache
+        self._cache_duration: float = 30.0
+        self._last_change_ts: float = time.monotonic()
+
+        # Parsed entries keyed by mode: {mode: (cache_generation, entries)}.
+        # The generation bumps whenever the raw cache changes, so parsed
+        # entries stay exactly as fresh as the data they were built from
+        # and repeat get_leaderboard calls stop re-instantiating entries.
+        self._entries_cache: Dict[str, Tuple[int, List['LeaderboardEntry']]] = {}
+        self._cache_gen: int = 0
+
+        # Negated score lists for rank bisection, same generation scheme
+        self._scores_cache: Dict[str, Tuple[int, List[int]]] = {}
+
+        # ETag of the last leaderboard response, for conditional refreshes
+        self._etag: Optional[str] = None
+
+        # In-flight fetch as (cache_generation, future): concurrent async
+        # fetches share one round trip instead of each hitting the Worker.
+        # A submit bumps the generation, which both unjoins and uncaches a
+        # fetch that started before it (its data predates the new score).
+        self._inflight: Optional[Tuple[int, asyncio.Future]] = None
 
         # Online mode (always True if worker URL is set)
         self.online_mode = bool(self.worker_url)
 
+        # Shared HTTP session (desktop only, created lazily): keep-alive
+        # reuses the TLS connection to the Worker across calls
+        self._http = None
+
         # Async operation results (for Web version)
         self._last_fetch_result: Optional[Dict] = None
         self._last_submit_result: Optional[Tuple[bool, str]] = None
 
+    def _store_cache(self, data: Dict) -> None:
+        """Store a fetch result and adapt the TTL to the update rate.
+
+        The TTL grows to a quarter of the observed quiet interval
+        (clamped to 5-300s), so a stable board stops burning refreshes
+        while fresh activity keeps the cache short-lived. Only actual
+        content changes bump the cache generation, so 304-style refreshes
+        don't churn the parsed-entry caches.
+        """
+        now = time.monotonic()
+        if data is not self._cache and data != self._cache:
+            self._cache = data
+            self._cache_gen += 1
+            self._last_change_ts = now
+        self._cache_time = now
+        self._cache_duration = min(300.0, max(5.0, (now - self._last_change_ts) / 4))
+
+    def _get_http_session(self):
+        """Get the shared requests.Session, creating it on first use."""
+        if self._http is None:
+            from requests.adapters import HTTPAdapter
+            self._http = requests.Session()
+            self._http.headers['Content-Type'] = 'application/json'
+            # Small pool is plenty for one host; disable urllib3's silent
+            # retries since we do our own single retry so failures surface
+            # quickly instead of stacking backoffs
+            self._http.mount('https://', HTTPAdapter(
+                pool_connections=2, pool_maxsize=4, max_retries=0))
+        return self._http
+
     def _fetch_leaderboard_sync(self) -> Optional[Dict]:
         """Fetch leaderboard using synchronous requests (desktop only)."""
-        try:
-            import requests
-            url = f'{self.worker_url}/leaderboard'
-            response = requests.get(url, timeout=5)
-
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Failed to fetch leaderboard: {response.status_code}")
-                return None
-        except Exception as e:
-            print(f"Error fetching leaderboard: {e}")
+        if not _REQUESTS_OK:
             return None
+        url = f'{self.worker_url}/leaderboard'
+        # Conditional GET: once we hold data and an ETag, a refresh where
+        # nothing changed comes back as an empty 304 instead of the full
+        # JSON body
+        headers = {}
+        if self._etag and self._cache:
+            headers['If-None-Match'] = self._etag
+        # One immediate retry after a short pause, then give up loudly.
+        # The (connect, read) timeout tuple fails fast when the edge is
+        # unreachable instead of burning the whole read budget connecting.
+        for attempt in range(2):
+            try:
+                response = self._get_http_session().get(
+                    url, headers=headers, timeout=(2, 5))
+                if response.status_code == 200:
+                    self._etag = response.headers.get('ETag')
+                    return _loads(response.content)
+                if response.status_code == 304:
+                    return self._cache
+                print(f"Failed to fetch leaderboard: {response.status_code}")
+            except Exception as e:
+                print(f"Error fetching leaderboard: {e}")
+            if attempt == 0:
+                time.sleep(0.2)
+        return None
+
+    @staticmethod
+    async def _run_web_xhr(method: str, url: str, body: Optional[str],
+                           slot: str, timeout: float) -> Optional[Dict]:
+        """Run an asynchronous XMLHttpRequest and poll for its result.
+
+        Synchronous XHR blocks the browser main thread (freezing the
+        canvas for the whole round trip), while awaiting a JS promise
+        from window.eval hangs under Pygbag. Instead, fire an async XHR
+        that parks its result on a window global and poll that global
+        between frames — the game keeps rendering during the request.
+
+        Args:
+            method: 'GET' or 'POST'
+            url: Request URL
+            body: JSON string body (POST) or None
+            slot: Name of the window global used for the result
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            Result dict with ok/status/text keys, or None on timeout
+        """
+        from platform import window
+
+        send_arg = f"'{body}'" if body is not None else 'null'
+        content_type = (
+            'xhr.setRequestHeader("Content-Type", "application/json");'
+            if body is not None else ''
+        )
+        js_code = f'''
+        window.{slot} = null;
+        (function() {{
+            var xhr = new XMLHttpRequest();
+            xhr.open("{method}", "{url}", true);
+            {content_type}
+            xhr.onloadend = function() {{
+                window.{slot} = JSON.stringify({{ok: xhr.status === 200, status: xhr.status, text: xhr.responseText}});
+            }};
+            xhr.onerror = function() {{
+                window.{slot} = JSON.stringify({{ok: false, status: 0, text: "network error"}});
+            }};
+            try {{
+                xhr.send({send_arg});
+            }} catch (e) {{
+                window.{slot} = JSON.stringify({{ok: false, status: 0, text: e.toString()}});
+            }}
+        }})();
+        '''
+        window.eval(js_code)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            result_str = window.eval(f'window.{slot}')
+            if result_str:
+                window.eval(f'window.{slot} = null;')
+                return _loads(result_str)
+            await asyncio.sleep(0.05)
+        return None
 
     async def _fetch_leaderboard_web_async(self) -> Optional[Dict]:
-        """Fetch leaderboard using synchronous XMLHttpRequest (Web only)."""
+        """Fetch leaderboard without blocking the browser thread (Web only)."""
         try:
-            from platform import window
             url = f'{self.worker_url}/leaderboard'
+            result_data = await self._run_web_xhr(
+                'GET', url, None, '__tetris_lb_fetch', timeout=10.0)
 
-            # Use synchronous XMLHttpRequest (simpler and more reliable)
-            js_code = f'''
-            (function() {{
-                var xhr = new XMLHttpRequest();
-                xhr.open("GET", "{url}", false);
-                try {{
-                    xhr.send(null);
-                    return JSON.stringify({{ok: xhr.status === 200, status: xhr.status, text: xhr.responseText}});
-                }} catch (e) {{
-                    return JSON.stringify({{ok: false, status: 0, text: e.toString()}});
-                }}
-            }})()
-            '''
-
-            result_str = window.eval(js_code)
-            result_data = json.loads(result_str)
-
+            if result_data is None:
+                print("Leaderboard fetch timed out")
+                return None
             if result_data['ok']:
-                return json.loads(result_data['text'])
+                return _loads(result_data['text'])
             else:
                 print(f"Failed to fetch leaderboard: {result_data['status']} - {result_data['text']}")
                 return None
@@ -143,7 +322,7 @@ class GistLeaderboardManager:
             return None
 
         # Check cache
-        if self._cache and (time.time() - self._cache_time < self._cache_duration):
+        if self._cache and (time.monotonic() - self._cache_time < self._cache_duration):
             return self._cache
 
         # For Web, return cached result if available (async fetch happens separately)
@@ -153,8 +332,7 @@ class GistLeaderboardManager:
         # Desktop: use sync request
         data = self._fetch_leaderboard_sync()
         if data:
-            self._cache = data
-            self._cache_time = time.time()
+            self._store_cache(data)
 
         return data
 
@@ -168,34 +346,66 @@ class GistLeaderboardManager:
             return None
 
         # Check cache
-        if self._cache and (time.time() - self._cache_time < self._cache_duration):
+        if self._cache and (time.monotonic() - self._cache_time < self._cache_duration):
             return self._cache
 
-        if IS_WEB:
-            data = await self._fetch_leaderboard_web_async()
-        else:
-            data = self._fetch_leaderboard_sync()
-
-        if data:
-            self._cache = data
-            self._cache_time = time.time()
-            self._last_fetch_result = data
-
-        return data
+        # Single-flight: if a fetch from the current cache generation is
+        # already in progress, await its result instead of issuing a
+        # duplicate request. A fetch from an older generation raced a
+        # submit, so it is neither joined nor allowed to repopulate the
+        # cache with pre-submit data when it lands.
+        gen = self._cache_gen
+        if self._inflight is not None and self._inflight[0] == gen:
+            return await self._inflight[1]
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight = (gen, future)
+        try:
+            if IS_WEB:
+                data = await self._fetch_leaderboard_web_async()
+            else:
+                # Run the blocking requests call in a worker thread so the
+                # asyncio loop (and the pygame frame loop) keeps ticking
+                data = await asyncio.to_thread(self._fetch_leaderboard_sync)
+
+            if data and self._cache_gen == gen:
+                self._store_cache(data)
+                self._last_fetch_result = data
+
+            future.set_result(data)
+            return data
+        finally:
+            if self._inflight is not None and self._inflight[1] is future:
+                self._inflight = None
+            if not future.done():
+                future.set_result(None)
 
     def _submit_score_sync(self, payload: Dict) -> Tuple[bool, str]:
         """Submit score using synchronous requests (desktop only)."""
+        if not _REQUESTS_OK:
+            return False, "requests library not available"
         try:
-            import requests
             url = f'{self.worker_url}/submit'
-            response = requests.post(url, json=payload, timeout=10)
+            # data= with a pre-encoded body; json= would re-serialize the
+            # payload on every call (the session already sends the
+            # application/json Content-Type)
+            body = _dumps(payload).encode()
+            headers = {}
+            if len(body) > 256:
+                # Not worth the CPU for the typical ~150-byte payload;
+                # level 1 keeps compression cheap when it does kick in
+                body = gzip.compress(body, compresslevel=1)
+                headers['Content-Encoding'] = 'gzip'
+            response = self._get_http_session().post(url, data=body,
+                                                     headers=headers,
+                                                     timeout=(2, 10))
 
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 return True, result.get('message', 'Score submitted!')
             else:
                 try:
-                    error_data = response.json()
+                    error_data = _loads(response.content)
                     error_msg = error_data.get('error', f'HTTP {response.status_code}')
                 except Exception:
                     error_msg = f'HTTP {response.status_code}'
@@ -205,34 +415,17 @@ class GistLeaderboardManager:
             return False, "Failed to submit score (network error)"
 
     async def _submit_score_web_async(self, payload: Dict) -> Tuple[bool, str]:
-        """Submit score using synchronous XMLHttpRequest (Web only)."""
+        """Submit score without blocking the browser thread (Web only)."""
         try:
-            from platform import window
-
             url = f'{self.worker_url}/submit'
-            body = json.dumps(payload)
-
-            # Use synchronous XMLHttpRequest (same as GET method)
-            # Async fetch with await doesn't work properly in Pygbag
-            js_code = f'''
-            (function() {{
-                var xhr = new XMLHttpRequest();
-                xhr.open("POST", "{url}", false);
-                xhr.setRequestHeader("Content-Type", "application/json");
-                try {{
-                    xhr.send('{body}');
-                    return JSON.stringify({{ok: xhr.status === 200, status: xhr.status, text: xhr.responseText}});
-                }} catch (e) {{
-                    return JSON.stringify({{ok: false, status: 0, text: e.toString()}});
-                }}
-            }})()
-            '''
-
-            result_str = window.eval(js_code)
-            result_data = json.loads(result_str)
+            body = _dumps(payload)
+            result_data = await self._run_web_xhr(
+                'POST', url, body, '__tetris_lb_submit', timeout=15.0)
 
+            if result_data is None:
+                return False, "Submit timed out"
             if result_data['ok']:
-                response_json = json.loads(result_data['text'])
+                response_json = _loads(result_data['text'])
                 if response_json.get('success'):
                     return True, response_json.get('message', 'Score submitted!')
                 else:
@@ -244,6 +437,26 @@ class GistLeaderboardManager:
             print(f"Error submitting score (web): {e}")
             return False, f"Failed to submit: {e}"
 
+    @staticmethod
+    def _top_entries(entries: List['LeaderboardEntry'],
+                     limit: int) -> List['LeaderboardEntry']:
+        """Select the top-scoring entries without a full sort.
+
+        heapq.nlargest is O(n log limit) and also stops us depending on the
+        Worker's response ordering.
+        """
+        if len(entries) <= limit:
+            return list(entries)
+        return heapq.nlargest(limit, entries, key=_score_key)
+
+    def _get_cached_entries(self, mode: str) -> Optional[List['LeaderboardEntry']]:
+        """Return parsed entries for a mode if built from the current raw
+        cache generation, else None."""
+        cached = self._entries_cache.get(mode)
+        if cached and cached[0] == self._cache_gen:
+            return cached[1]
+        return None
+
     def get_leaderboard(self, mode: str, limit: int = 10) -> List[LeaderboardEntry]:
         """Get top scores for a mode.
 
@@ -257,6 +470,10 @@ class GistLeaderboardManager:
         if not self.online_mode:
             return []
 
+        cached = self._get_cached_entries(mode)
+        if cached is not None:
+            return self._top_entries(cached, limit)
+
         data = self._fetch_leaderboard()
         if not data:
             return []
@@ -265,8 +482,8 @@ class GistLeaderboardManager:
         for entry_dict in data.get(mode, []):
             entries.append(LeaderboardEntry.from_dict(entry_dict))
 
-        # Already sorted by Worker, just apply limit
-        return entries[:limit]
+        self._entries_cache[mode] = (self._cache_gen, entries)
+        return self._top_entries(entries, limit)
 
     async def get_leaderboard_async(self, mode: str, limit: int = 10) -> List[LeaderboardEntry]:
         """Get top scores for a mode asynchronously.
@@ -281,6 +498,10 @@ class GistLeaderboardManager:
         if not self.online_mode:
             return []
 
+        cached = self._get_cached_entries(mode)
+        if cached is not None:
+            return self._top_entries(cached, limit)
+
         data = await self.fetch_leaderboard_async()
         if not data:
             return []
@@ -289,7 +510,8 @@ class GistLeaderboardManager:
         for entry_dict in data.get(mode, []):
             entries.append(LeaderboardEntry.from_dict(entry_dict))
 
-        return entries[:limit]
+        self._entries_cache[mode] = (self._cache_gen, entries)
+        return self._top_entries(entries, limit)
 
     def submit_score(self, entry: LeaderboardEntry) -> Tuple[bool, str]:
         """Submit a new score to the leaderboard via Worker API (sync).
@@ -314,19 +536,12 @@ class GistLeaderboardManager:
                 return result
             return False, "Submitting..."
 
-        # Desktop: use sync request
-        payload = {
-            'player_id': entry.player_id,
-            'score': entry.score,
-            'lines': entry.lines,
-            'level': entry.level,
-            'mode': entry.mode
-        }
-
         # Invalidate cache
         self._cache = None
+        self._cache_gen += 1
 
-        return self._submit_score_sync(payload)
+        # Desktop: use sync request
+        return self._submit_score_sync(entry._submit_payload)
 
     async def submit_score_async(self, entry: LeaderboardEntry) -> Tuple[bool, str]:
         """Submit a new score to the leaderboard asynchronously.
@@ -340,23 +555,38 @@ class GistLeaderboardManager:
         if not self.online_mode:
             return False, "Offline mode: No worker URL configured"
 
-        payload = {
-            'player_id': entry.player_id,
-            'score': entry.score,
-            'lines': entry.lines,
-            'level': entry.level,
-            'mode': entry.mode
-        }
+        payload = entry._submit_payload
 
         # Invalidate cache
         self._cache = None
+        self._cache_gen += 1
 
         if IS_WEB:
             result = await self._submit_score_web_async(payload)
             self._last_submit_result = result
             return result
         else:
-            return self._submit_score_sync(payload)
+            # Off-thread so the 10s submit timeout can't stall the frame loop
+            return await asyncio.to_thread(self._submit_score_sync, payload)
+
+    async def get_snapshot_async(self, mode: str, score: int,
+                                 limit: int = 10) -> Tuple[List[LeaderboardEntry], Optional[int]]:
+        """Get top entries and the rank for a score in one round trip.
+
+        The rank lookup reuses the entries parsed for the same cache
+        generation, so this costs a single fetch and a single parse
+        instead of two serialized calls.
+
+        Args:
+            mode: Game mode (casual/classic/crazy)
+            score: Score to rank
+            limit: Maximum number of entries to return
+
+        Returns:
+            Tuple of (top entries, 1-indexed rank)
+        """
+        entries = await self.get_leaderboard_async(mode, limit)
+        return entries, self.get_player_rank(mode, score)
 
     def get_player_rank(self, mode: str, score: int) -> Optional[int]:
         """Get rank for a given score in a mode.
@@ -372,10 +602,17 @@ class GistLeaderboardManager:
         if not entries:
             return 1  # First player
 
-        rank = 1
-        for entry in entries:
-            if score > entry.score:
-                return rank
-            rank += 1
+        # Entries are sorted descending; bisect a negated (ascending) score
+        # list instead of scanning linearly. The list is cached per raw
+        # cache generation so repeated rank checks skip rebuilding it.
+        cached = self._scores_cache.get(mode)
+        if cached and cached[0] == self._cache_gen:
+            neg_scores = cached[1]
+        else:
+            neg_scores = [-e.score for e in entries]
+            self._scores_cache[mode] = (self._cache_gen, neg_scores)
 
-        return rank  # Lower than all existing scores
+        # Standard competition rank: one more than the number of strictly
+        # higher scores, so ties share the better rank and the player's
+        # own just-submitted entry doesn't push their rank down
+        return bisect.bisect_left(neg_scores, -score) + 1
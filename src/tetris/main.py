@@ -8,9 +8,24 @@ from .game import GameEnhanced
 from .save_manager import SaveManager
 from .constants import GameMode
 
+# Use uvloop's faster event loop for the per-frame asyncio.sleep yields and
+# leaderboard I/O when available. Desktop-only: pygbag ships its own loop
+# and uvloop does not support Windows.
+if sys.platform not in ("win32", "emscripten"):
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # Optional dependency; stdlib loop works fine
+
 
 async def main():
     """Run the complete game with mode selection."""
+    # Let tasks that finish without yielding (e.g. cache-hit leaderboard
+    # fetches) skip the scheduler entirely. Python 3.12+ only.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Initialize save manager
     save_manager = SaveManager()
 
@@ -60,15 +75,12 @@ async def main():
         game.high_score = save_manager.get_high_score(selected_mode.value)
         await game.run_async()
 
-        # Save high score and stats
+        # Save high score, stats, and mode unlocks in one write
         if game.score > 0:
-            save_manager.update_high_score(selected_mode.value, game.score)
-            save_manager.add_lines(selected_mode.value, game.lines_cleared)
-
-        # Check for mode unlocks
-        newly_unlocked = save_manager.check_and_unlock_modes()
-        if newly_unlocked:
-            print(f"Unlocked modes: {', '.join(newly_unlocked)}")
+            newly_unlocked = save_manager.finalize_game(
+                selected_mode.value, game.score, game.lines_cleared)
+            if newly_unlocked:
+                print(f"Unlocked modes: {', '.join(newly_unlocked)}")
 
         # Game ended, loop back to menu
 
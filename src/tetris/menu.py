@@ -2,15 +2,34 @@
 
 import pygame
 import asyncio
+import time
 from typing import Optional
 from .constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, FPS,
-    COLOR_BACKGROUND, COLOR_WHITE, COLOR_LIGHT_GRAY,
+    COLOR_BACKGROUND, COLOR_WHITE, COLOR_LIGHT_GRAY, COLOR_TEXT,
     COLOR_BUTTON_NORMAL, COLOR_BUTTON_HOVER, COLOR_BUTTON_LOCKED,
     GameMode
 )
 from .save_manager import SaveManager
 
+# Font objects cached across menu instances: re-entering the menu after a
+# game skips rebuilding four FreeType faces. The cache must be dropped
+# whenever pygame has been quit (battle modes do this), since Font objects
+# do not survive a font-module teardown.
+_FONT_CACHE: dict = {}
+
+# Sentinel distinguishing "user quit the menu" from "no selection yet"
+_MENU_QUIT = object()
+
+
+def _font(size: int) -> pygame.font.Font:
+    """Get a cached default font of the given size."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _FONT_CACHE[size] = font
+    return font
+
 
 class ModeButton:
     """Clickable mode button."""
@@ -25,11 +44,41 @@ class ModeButton:
         self.unlocked = unlocked
         self.hovered = False
         self.icon = icon
+        # Icon destination never moves; computed once (icons are already
+        # display-converted at load time)
+        self._icon_pos = (self.rect.right - 70, self.rect.centery - 30) if icon else None
+
+        # Label surfaces are static; rendered once on first draw instead
+        # of rasterizing the fonts every frame
+        self._name_surf = None
+        self._name_rect = None
+        self._desc_surf = None
+        self._desc_rect = None
+        self._lock_surf = None
+        self._lock_rect = None
 
     def update(self, mouse_pos: tuple) -> None:
         """Update button state."""
         self.hovered = self.rect.collidepoint(mouse_pos) and self.unlocked
 
+    def _build_label_cache(self, font_large: pygame.font.Font,
+                           font_small: pygame.font.Font) -> None:
+        """Pre-render the static label surfaces and their positions."""
+        # Text color - use dark text on light background for better contrast
+        text_color = COLOR_TEXT if self.unlocked else (140, 140, 140)
+        cx, cy = self.rect.centerx, self.rect.centery
+
+        self._name_surf = font_large.render(self.display_name, True, text_color)
+        self._name_rect = self._name_surf.get_rect(center=(cx, cy - 20))
+
+        self._desc_surf = font_small.render(self.description, True, text_color)
+        self._desc_rect = self._desc_surf.get_rect(center=(cx, cy + 20))
+
+        if not self.unlocked:
+            self._lock_surf = font_small.render("[LOCKED]", True, text_color)
+            self._lock_rect = self._lock_surf.get_rect(
+                center=(cx, self.rect.bottom - 20))
+
     def draw(self, screen: pygame.Surface, font_large: pygame.font.Font,
              font_small: pygame.font.Font) -> None:
         """Draw button."""
@@ -44,31 +93,20 @@ class ModeButton:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, COLOR_WHITE, self.rect, 2)
 
-        # Text color - use dark text on light background for better contrast
-        from .constants import COLOR_TEXT
-        text_color = COLOR_TEXT if self.unlocked else (140, 140, 140)
-
-        # Mode name
-        text = font_large.render(self.display_name, True, text_color)
-        text_rect = text.get_rect(center=(self.rect.centerx, self.rect.centery - 20))
-        screen.blit(text, text_rect)
+        if self._name_surf is None:
+            self._build_label_cache(font_large, font_small)
 
-        # Description
-        desc = font_small.render(self.description, True, text_color)
-        desc_rect = desc.get_rect(center=(self.rect.centerx, self.rect.centery + 20))
-        screen.blit(desc, desc_rect)
+        # Mode name and description (cached surfaces)
+        screen.blit(self._name_surf, self._name_rect)
+        screen.blit(self._desc_surf, self._desc_rect)
 
         # Cat icon on the right side
         if self.icon:
-            icon_x = self.rect.right - 70
-            icon_y = self.rect.centery - 30
-            screen.blit(self.icon, (icon_x, icon_y))
+            screen.blit(self.icon, self._icon_pos)
 
         # Lock icon
-        if not self.unlocked:
-            lock_text = font_small.render("[LOCKED]", True, text_color)
-            lock_rect = lock_text.get_rect(center=(self.rect.centerx, self.rect.bottom - 20))
-            screen.blit(lock_text, lock_rect)
+        if self._lock_surf is not None:
+            screen.blit(self._lock_surf, self._lock_rect)
 
     def is_clicked(self, mouse_pos: tuple) -> bool:
         """Check if button was clicked."""
@@ -80,46 +118,50 @@ class ModeSelectionMenu:
 
     def __init__(self, save_manager: SaveManager):
         """Initialize menu."""
+        if not pygame.font.get_init():
+            # pygame was quit since the cache was filled; the old Font
+            # objects are dead
+            _FONT_CACHE.clear()
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Claire's Tetris - Select Mode")
         self.clock = pygame.time.Clock()
+
+        # Only the event types the menu consumes; SDL drops the rest
+        # (MOUSEMOTION floods etc.) at the source. quit() restores the
+        # default so game states see everything again.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
         self.save_manager = save_manager
 
         # Fonts - use English only for web compatibility
         # Chinese characters don't render well in Pygbag web environment
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_large = pygame.font.Font(None, 42)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
-
-        # Load cat icon with smooth scaling for better quality
-        try:
-            cat_img = pygame.image.load("images/cat.jpg")
-            self.cat_icon = pygame.transform.smoothscale(cat_img, (50, 50))
-        except (pygame.error, FileNotFoundError):
-            self.cat_icon = None
-
-        # Load mode icons (cat1, cat2, cat3)
-        self.mode_icons = {}
+        self.font_title = _font(72)
+        self.font_large = _font(42)
+        self.font_medium = _font(36)
+        self.font_small = _font(24)
+
+        # Load icons with smooth scaling for better quality. convert()
+        # matches the display pixel format once at load time, so blits
+        # skip the per-frame conversion SDL would otherwise do (the JPEGs
+        # are opaque, so plain convert beats convert_alpha here).
+        def _load_icon(name: str, size: tuple):
+            try:
+                img = pygame.image.load(f"images/{name}.jpg")
+                return pygame.transform.smoothscale(img, size).convert()
+            except (pygame.error, FileNotFoundError):
+                return None
+
+        self.cat_icon = _load_icon("cat", (50, 50))
+
+        # Mode icons (cat1, cat2, cat3)
         icon_size = (60, 60)
-        try:
-            cat1_img = pygame.image.load("images/cat1.jpg")
-            self.mode_icons['casual'] = pygame.transform.smoothscale(cat1_img, icon_size)
-        except (pygame.error, FileNotFoundError):
-            self.mode_icons['casual'] = None
-
-        try:
-            cat2_img = pygame.image.load("images/cat2.jpg")
-            self.mode_icons['classic'] = pygame.transform.smoothscale(cat2_img, icon_size)
-        except (pygame.error, FileNotFoundError):
-            self.mode_icons['classic'] = None
-
-        try:
-            cat3_img = pygame.image.load("images/cat3.jpg")
-            self.mode_icons['crazy'] = pygame.transform.smoothscale(cat3_img, icon_size)
-        except (pygame.error, FileNotFoundError):
-            self.mode_icons['crazy'] = None
+        self.mode_icons = {
+            mode: _load_icon(name, icon_size)
+            for mode, name in (
+                ('casual', 'cat1'), ('classic', 'cat2'), ('crazy', 'cat3'))
+        }
 
         # Create buttons - 6 modes (smaller buttons to fit all)
         button_width = 420
@@ -198,135 +240,159 @@ class ModeSelectionMenu:
 
         self.selected_mode: Optional[GameMode] = None
 
+        # Buttons share one x-span and a uniform vertical pitch, so hover
+        # and click tests reduce to one band computation instead of six
+        # collidepoint calls per frame
+        self._btn_x0 = WINDOW_WIDTH // 2 - button_width // 2
+        self._btn_x1 = self._btn_x0 + button_width
+        self._btn_y0 = start_y
+        self._btn_pitch = button_height + button_spacing
+        self._btn_h = button_height
+        self._hovered_button: Optional[ModeButton] = None
+
+        # Static menu chrome (background, title, subtitle, cat icon) is
+        # composited into one screen-sized surface: each frame starts from
+        # a single blit instead of a fill plus several draw calls
+        title_surf = self.font_title.render("CLAIRE'S TETRIS", True, COLOR_TEXT)
+        title_rect = title_surf.get_rect(center=(WINDOW_WIDTH // 2, 60))
+        subtitle_surf = self.font_medium.render("Select Game Mode", True, COLOR_TEXT)
+        subtitle_rect = subtitle_surf.get_rect(center=(WINDOW_WIDTH // 2, 120))
+
+        self._chrome = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._chrome.fill(COLOR_BACKGROUND)
+        self._chrome.blit(title_surf, title_rect)
+        self._chrome.blit(subtitle_surf, subtitle_rect)
+        if self.cat_icon:
+            self._chrome.blit(
+                self.cat_icon,
+                (subtitle_rect.right + 10, subtitle_rect.centery - 25))
+
+    def _hit(self, pos: tuple) -> Optional[ModeButton]:
+        """Return the unlocked button under pos, or None.
+
+        Uses the uniform button layout: one divmod against the vertical
+        pitch instead of testing every button's rect.
+        """
+        x, y = pos
+        if not (self._btn_x0 <= x < self._btn_x1 and y >= self._btn_y0):
+            return None
+        idx, offset = divmod(y - self._btn_y0, self._btn_pitch)
+        if offset >= self._btn_h or idx >= len(self.buttons):
+            return None
+        button = self.buttons[idx]
+        return button if button.unlocked else None
+
+    def _handle_events(self, events, mouse_pos: tuple):
+        """Process one frame's events.
+
+        Returns:
+            A GameMode selection, _MENU_QUIT for quit/escape, or None to
+            keep running.
+        """
+        for event in events:
+            if event.type == pygame.QUIT:
+                return _MENU_QUIT
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return _MENU_QUIT
+                elif event.key == pygame.K_1:
+                    return GameMode.CASUAL
+                elif event.key == pygame.K_2:
+                    return GameMode.CLASSIC
+                elif event.key == pygame.K_3:
+                    if self.save_manager.is_mode_unlocked("crazy"):
+                        return GameMode.CRAZY
+                elif event.key == pygame.K_4:
+                    return GameMode.BATTLE
+                elif event.key == pygame.K_5:
+                    return GameMode.ONLINE_BATTLE
+                elif event.key == pygame.K_6:
+                    return GameMode.MOBILE_ONLINE
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                clicked = self._hit(mouse_pos)
+                if clicked is not None:
+                    return clicked.mode
+        return None
+
+    def _update_hover(self, mouse_pos: tuple) -> bool:
+        """Track the hovered button via the O(1) band lookup.
+
+        Returns:
+            True if the hover state changed (the menu needs a redraw).
+        """
+        hit = self._hit(mouse_pos)
+        if hit is self._hovered_button:
+            return False
+        if self._hovered_button is not None:
+            self._hovered_button.hovered = False
+        if hit is not None:
+            hit.hovered = True
+        self._hovered_button = hit
+        return True
+
+    def _render(self) -> None:
+        """Draw one full menu frame."""
+        # Static chrome in one blit, then only the hover-dependent buttons
+        self.screen.blit(self._chrome, (0, 0))
+        for button in self.buttons:
+            button.draw(self.screen, self.font_large, self.font_small)
+
+        pygame.display.flip()
+
     def run(self) -> Optional[GameMode]:
         """Run menu and return selected mode."""
-        running = True
-        while running:
+        dirty = True  # force the first frame
+        while True:
+            # Sleep in the OS until an event arrives (or ~one frame) so an
+            # idle menu costs roughly nothing, then drain the queue
+            first = pygame.event.wait(16)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+
             mouse_pos = pygame.mouse.get_pos()
+            outcome = self._handle_events(events, mouse_pos)
+            if outcome is _MENU_QUIT:
+                return None
+            if outcome is not None:
+                return outcome
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return None
-                    elif event.key == pygame.K_1:
-                        return GameMode.CASUAL
-                    elif event.key == pygame.K_2:
-                        return GameMode.CLASSIC
-                    elif event.key == pygame.K_3:
-                        if self.save_manager.is_mode_unlocked("crazy"):
-                            return GameMode.CRAZY
-                    elif event.key == pygame.K_4:
-                        return GameMode.BATTLE
-                    elif event.key == pygame.K_5:
-                        return GameMode.ONLINE_BATTLE
-                    elif event.key == pygame.K_6:
-                        return GameMode.MOBILE_ONLINE
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_pos):
-                            return button.mode
-
-            # Update
-            for button in self.buttons:
-                button.update(mouse_pos)
-
-            # Draw
-            self.screen.fill(COLOR_BACKGROUND)
-
-            # Title
-            from .constants import COLOR_TEXT
-            title = self.font_title.render("CLAIRE'S TETRIS", True, COLOR_TEXT)
-            title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 60))
-            self.screen.blit(title, title_rect)
-
-            # Subtitle with cat icon
-            subtitle = self.font_medium.render("Select Game Mode", True, COLOR_TEXT)
-            subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 120))
-            self.screen.blit(subtitle, subtitle_rect)
-
-            # Cat icon next to subtitle
-            if self.cat_icon:
-                cat_x = subtitle_rect.right + 10
-                cat_y = subtitle_rect.centery - 25
-                self.screen.blit(self.cat_icon, (cat_x, cat_y))
-
-            # Buttons
-            for button in self.buttons:
-                button.draw(self.screen, self.font_large, self.font_small)
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            if self._update_hover(mouse_pos):
+                dirty = True
 
-        return None
+            # Draw only when something changed
+            if dirty:
+                self._render()
+                dirty = False
 
     async def run_async(self) -> Optional[GameMode]:
         """Run menu and return selected mode (async version for web)."""
-        running = True
-        while running:
+        dirty = True  # force the first frame
+        target_dt = 1.0 / FPS
+        while True:
+            frame_start = time.monotonic()
             mouse_pos = pygame.mouse.get_pos()
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return None
-                    elif event.key == pygame.K_1:
-                        return GameMode.CASUAL
-                    elif event.key == pygame.K_2:
-                        return GameMode.CLASSIC
-                    elif event.key == pygame.K_3:
-                        if self.save_manager.is_mode_unlocked("crazy"):
-                            return GameMode.CRAZY
-                    elif event.key == pygame.K_4:
-                        return GameMode.BATTLE
-                    elif event.key == pygame.K_5:
-                        return GameMode.ONLINE_BATTLE
-                    elif event.key == pygame.K_6:
-                        return GameMode.MOBILE_ONLINE
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_pos):
-                            return button.mode
-
-            # Update
-            for button in self.buttons:
-                button.update(mouse_pos)
-
-            # Draw
-            self.screen.fill(COLOR_BACKGROUND)
-
-            # Title
-            from .constants import COLOR_TEXT
-            title = self.font_title.render("CLAIRE'S TETRIS", True, COLOR_TEXT)
-            title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 60))
-            self.screen.blit(title, title_rect)
-
-            # Subtitle with cat icon
-            subtitle = self.font_medium.render("Select Game Mode", True, COLOR_TEXT)
-            subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 120))
-            self.screen.blit(subtitle, subtitle_rect)
-
-            # Cat icon next to subtitle
-            if self.cat_icon:
-                cat_x = subtitle_rect.right + 10
-                cat_y = subtitle_rect.centery - 25
-                self.screen.blit(self.cat_icon, (cat_x, cat_y))
-
-            # Buttons
-            for button in self.buttons:
-                button.draw(self.screen, self.font_large, self.font_small)
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
-            # Yield control to event loop
-            await asyncio.sleep(0)
+            outcome = self._handle_events(pygame.event.get(), mouse_pos)
+            if outcome is _MENU_QUIT:
+                return None
+            if outcome is not None:
+                return outcome
 
-        return None
+            if self._update_hover(mouse_pos):
+                dirty = True
+
+            # Draw only when something changed
+            if dirty:
+                self._render()
+                dirty = False
+
+            # Sleep the remaining frame budget instead of busy-waiting in
+            # clock.tick: on an idle (clean) frame this is a full ~16ms,
+            # letting the browser throttle the tab properly
+            await asyncio.sleep(max(0.0, target_dt - (time.monotonic() - frame_start)))
 
     def quit(self) -> None:
         """Quit menu."""
+        pygame.event.set_allowed(None)  # lift the menu's event filter
         pygame.quit()
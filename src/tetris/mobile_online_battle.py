@@ -33,7 +33,6 @@ class MobileOnlineBattleGame:
 
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Claire's Tetris - Online Battle")
         self.clock = pygame.time.Clock()
 
@@ -50,6 +49,18 @@ class MobileOnlineBattleGame:
         self.opponent_disconnected = False
         self.game_result = None
 
+        # Bound in run_async once the loop is running
+        self._loop = None
+        self._send_garbage = None
+        self._send_debuff = None
+        self._send_game_over = None
+        self._send_state = None
+
+        # Block pool: locked pieces go back here and spawns reuse them,
+        # so a long match stops churning short-lived Block allocations
+        self._piece_pool = {}  # block type -> list of reusable Blocks
+        self._shape_types = {}  # id(shape) -> block type
+
         # Server block sequences
         self.my_block_sequence = []
         self.opponent_block_sequence = []
@@ -59,7 +70,13 @@ class MobileOnlineBattleGame:
         # Game state
         self.state = GameState.PLAYING
         self.board = Board(10, 20)  # Standard Tetris grid
-        self.renderer = Renderer()
+        # DOUBLEBUF pairs with the dirty-rect update path; SCALED keeps
+        # blits in the display's native pixel format. Renderer owns the
+        # set_mode call, so the flags go through it instead of being
+        # clobbered by its default mode
+        self.renderer = Renderer(
+            display_flags=pygame.SCALED | pygame.DOUBLEBUF)
+        self.screen = self.renderer.screen
         self.touch_controls = TouchControlManager()
 
         # Player state
@@ -91,14 +108,70 @@ class MobileOnlineBattleGame:
         self.time_remaining = BATTLE_DURATION
         self.server_time_remaining = BATTLE_DURATION
 
-        # Input handling
+        # Input handling (per-direction attributes rather than a dict so
+        # the per-frame repeat checks skip the key hashing)
         self.move_delay = 0.12
-        self.last_move_time = {'left': 0, 'right': 0, 'down': 0}
+        self.last_move_left = 0.0
+        self.last_move_right = 0.0
+        self.last_move_down = 0.0
 
         # Animation
         self.garbage_warning_flash = 0
         self._sync_counter = 0
 
+        # Outgoing sends queued during the frame (garbage, debuffs,
+        # game over) and flushed with a single task per frame
+        self._outgoing = []
+
+        # State-sync change detection: the grid revision bumps whenever
+        # locked cells change, so unchanged frames skip the network send
+        self._grid_rev = 0
+        self._last_sync_sig = None
+
+        # Dirty-rect bookkeeping: the status bar and play field change every
+        # frame (timer, falling piece) but the touch button strip below them
+        # only changes when a button's pressed state does, so _render pushes
+        # just the regions that changed. Full flips cover the first frame
+        # and full-window overlays.
+        touch_top = self.touch_controls.hold_button.y - 10
+        # The board (drawn at y=55 with a 5px border) can reach below the
+        # touch strip's top edge, so the every-frame play rect extends to
+        # whichever is lower; overlapping update rects are fine
+        board_bottom = 55 + self.board.height * self.renderer.cell_size + 5
+        play_bottom = max(touch_top, board_bottom)
+        self._bar_rect = pygame.Rect(0, 0, WINDOW_WIDTH, 55)
+        self._play_rect = pygame.Rect(0, 55, WINDOW_WIDTH, play_bottom - 55)
+        self._touch_rect = pygame.Rect(0, touch_top, WINDOW_WIDTH,
+                                       WINDOW_HEIGHT - touch_top)
+        self._last_touch_state = None
+        self._needs_full_flip = True
+
+        # Pre-built overlay surfaces; allocating and filling these every
+        # frame they are shown is a needless full-surface memset
+        self._gameover_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._gameover_overlay.fill((0, 0, 0))
+        self._gameover_overlay.set_alpha(180)
+        self._ink_overlay_cache = {}
+
+        # Rendered-text cache: font rasterization is one of the costliest
+        # per-frame pygame calls, and most HUD strings repeat frame after
+        # frame (labels always, the timer 59 of 60 frames)
+        self._text_cache = {}
+
+    def _text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Return a cached rendered surface for (font, text, color)."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) > 512:
+                # Score strings churn; keep the cache bounded
+                self._text_cache.clear()
+            # convert_alpha matches the display format so cached blits
+            # skip per-blit pixel conversion
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+
     async def connect_and_wait(self, player_name: str = "Player"):
         """Connect to server and wait for match."""
         success = await self.network.connect()
@@ -146,7 +219,7 @@ class MobileOnlineBattleGame:
     def _start_game(self):
         """Initialize game after match found."""
         self.state = GameState.PLAYING
-        self.game_start_time = time.time()
+        self.game_start_time = time.monotonic()
         self._spawn_block()
 
     def _get_next_block_type(self) -> str:
@@ -160,13 +233,33 @@ class MobileOnlineBattleGame:
             return block_type
         return random.choice(['I', 'O', 'T', 'S', 'Z', 'J', 'L'])
 
+    def _acquire_piece(self, block_type: str) -> Block:
+        """Get a Block of the given type, reusing a pooled instance if any."""
+        pool = self._piece_pool.get(block_type)
+        if pool:
+            block = pool.pop()
+            block.x = 0
+            block.y = 0
+            block.rotation = 0
+            return block
+        block = create_tetromino(block_type)
+        self._shape_types[id(block.shape)] = block_type
+        self._piece_pool.setdefault(block_type, [])
+        return block
+
+    def _release_piece(self, block: Block) -> None:
+        """Return a no-longer-referenced Block to the pool."""
+        block_type = self._shape_types.get(id(block.shape))
+        if block_type is not None:
+            self._piece_pool[block_type].append(block)
+
     def _spawn_block(self) -> bool:
         """Spawn a new block."""
         if self.next_block:
             self.current_block = self.next_block
         else:
             block_type = self._get_next_block_type()
-            self.current_block = create_tetromino(block_type)
+            self.current_block = self._acquire_piece(block_type)
 
         # Maybe spawn powerup
         if random.random() < BATTLE_POWERUP_SPAWN_RATE and len(self.powerups) < 2:
@@ -175,14 +268,15 @@ class MobileOnlineBattleGame:
 
         # Next block
         next_type = self._get_next_block_type()
-        self.next_block = create_tetromino(next_type)
+        self.next_block = self._acquire_piece(next_type)
 
-        # Center the block
-        current_shape = self.current_block.shape[self.current_block.rotation]
-        block_width = len(current_shape[0]) if current_shape else 0
+        # Center the block; reset rotation first so the width comes from
+        # the spawn orientation rather than a held block's last rotation
+        self.current_block.rotation = 0
+        spawn_shape = self.current_block.shape[0]
+        block_width = len(spawn_shape[0]) if spawn_shape else 0
         self.current_block.x = (self.board.width - block_width) // 2
         self.current_block.y = 0
-        self.current_block.rotation = 0
 
         # Check game over
         if not self.board.is_valid_position(self.current_block):
@@ -196,18 +290,39 @@ class MobileOnlineBattleGame:
 
     async def run_async(self, player_name: str = "Player"):
         """Main async game loop."""
+        # Filter events at the SDL layer: the loop only consumes quit,
+        # key and touch/mouse button events, so anything else (mouse
+        # motion in particular) never enters the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT, pygame.KEYDOWN,
+            pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+        ])
+
         connected = await self.connect_and_wait(player_name)
 
         if not connected:
             await self._show_error_screen()
             return
 
+        # Cache the running loop and the bound network send methods once.
+        # The per-event paths below (line clears, powerups, state sync) fire
+        # these every time; resolving get_running_loop() and the attribute
+        # chain on each call is avoidable overhead in a 60 FPS loop.
+        self._loop = asyncio.get_running_loop()
+        self._send_garbage = self.network.send_garbage
+        self._send_debuff = self.network.send_debuff
+        self._send_game_over = self.network.send_game_over
+        self._send_state = self.network.send_state
+
         running = True
         while running:
             dt = self.clock.tick(FPS) / 1000.0
+            # One timestamp per frame for all input/update timing
+            now = time.monotonic()
 
-            # Process network events
-            await self._process_network_events()
+            # Process network events (synchronous queue drain)
+            self._process_network_events()
 
             # Process pygame events
             for event in pygame.event.get():
@@ -218,24 +333,34 @@ class MobileOnlineBattleGame:
 
             # Handle continuous input
             if self.state == GameState.PLAYING:
-                self._handle_continuous_input()
-                self._update(dt)
+                self._handle_continuous_input(pygame.key.get_pressed(), now)
+                self._update(dt, now)
 
             # Render
             self._render()
 
-            # Sync state to server
-            await self._sync_state()
+            # Flush all sends queued this frame (garbage/debuff/game over)
+            # in one task so they hit the socket back-to-back instead of
+            # spawning a task per event
+            if self._outgoing:
+                batch, self._outgoing = self._outgoing, []
+                self._loop.create_task(self._flush_outgoing(batch))
+
+            # Sync state to server as a background task so the frame has a
+            # single yield point; with the eager task factory the common
+            # nothing-changed path completes without touching the scheduler
+            if self.state == GameState.PLAYING:
+                self._loop.create_task(self._sync_state())
 
             await asyncio.sleep(0)
 
         self.network.close()
         pygame.quit()
 
-    async def _process_network_events(self):
+    def _process_network_events(self):
         """Process incoming network events."""
         while True:
-            event = await self.network.get_event()
+            event = self.network.try_get_event()
             if not event:
                 break
 
@@ -248,7 +373,7 @@ class MobileOnlineBattleGame:
             elif event_type == 'GARBAGE':
                 lines = event.get('lines', 0)
                 self.pending_garbage += lines
-                self.garbage_warning_flash = time.time()
+                self.garbage_warning_flash = time.monotonic()
 
             elif event_type == 'TIME_SYNC':
                 self.server_time_remaining = event.get('remaining', 0) / 1000.0
@@ -271,8 +396,7 @@ class MobileOnlineBattleGame:
                 duration = event.get('duration', 5.0)
                 try:
                     debuff_enum = BattlePowerUpType(debuff_type_str)
-                    current_time = time.time()
-                    self.active_debuffs[debuff_enum] = current_time + duration
+                    self.active_debuffs[debuff_enum] = time.monotonic() + duration
                     logger.info(f"Applied debuff {debuff_enum}")
                 except ValueError:
                     pass
@@ -324,33 +448,36 @@ class MobileOnlineBattleGame:
         elif action == 'pause':
             pass  # No pause in online mode
 
-    def _handle_continuous_input(self):
-        """Handle held keys and touch zones."""
-        keys = pygame.key.get_pressed()
-        current_time = time.time()
+    def _handle_continuous_input(self, keys, current_time: float):
+        """Handle held keys and touch zones.
 
-        # Keyboard
-        if keys[pygame.K_LEFT] and current_time - self.last_move_time['left'] > self.move_delay:
+        Args:
+            keys: Snapshot from pygame.key.get_pressed()
+            current_time: Frame timestamp from time.monotonic()
+        """
+        move_delay = self.move_delay
+
+        # Keyboard and touch zones share the per-direction repeat timers
+        if ((keys[pygame.K_LEFT] or self.touch_controls.left_pressed)
+                and current_time - self.last_move_left > move_delay):
             self._move(-1, 0)
-            self.last_move_time['left'] = current_time
-        if keys[pygame.K_RIGHT] and current_time - self.last_move_time['right'] > self.move_delay:
+            self.last_move_left = current_time
+        if ((keys[pygame.K_RIGHT] or self.touch_controls.right_pressed)
+                and current_time - self.last_move_right > move_delay):
             self._move(1, 0)
-            self.last_move_time['right'] = current_time
-        if keys[pygame.K_DOWN] and current_time - self.last_move_time['down'] > self.move_delay:
+            self.last_move_right = current_time
+        if keys[pygame.K_DOWN] and current_time - self.last_move_down > move_delay:
             if self._move(0, 1):
                 self.score += SCORE_SOFT_DROP
-            self.last_move_time['down'] = current_time
+            self.last_move_down = current_time
 
-        # Touch zones
-        if self.touch_controls.is_left_held() and current_time - self.last_move_time['left'] > self.move_delay:
-            self._move(-1, 0)
-            self.last_move_time['left'] = current_time
-        if self.touch_controls.is_right_held() and current_time - self.last_move_time['right'] > self.move_delay:
-            self._move(1, 0)
-            self.last_move_time['right'] = current_time
+    def _update(self, dt: float, now: float):
+        """Update game state.
 
-    def _update(self, dt: float):
-        """Update game state."""
+        Args:
+            dt: Delta time in seconds
+            now: Frame timestamp from time.monotonic()
+        """
         if self.state != GameState.PLAYING:
             return
 
@@ -358,18 +485,20 @@ class MobileOnlineBattleGame:
         if self.server_time_remaining > 0:
             self.time_remaining = self.server_time_remaining
         else:
-            elapsed = time.time() - self.game_start_time
+            elapsed = now - self.game_start_time
             self.time_remaining = max(0, BATTLE_DURATION - elapsed)
 
         if self.time_remaining <= 0:
             self._end_game()
             return
 
-        # Update debuffs
-        current_time = time.time()
-        expired = [d for d, end_time in self.active_debuffs.items() if current_time > end_time]
-        for d in expired:
-            del self.active_debuffs[d]
+        # Update debuffs; the dict is empty on most frames, so one truth
+        # test short-circuits the expiry scan entirely
+        if self.active_debuffs:
+            expired = [d for d, end_time in self.active_debuffs.items()
+                       if now > end_time]
+            for d in expired:
+                del self.active_debuffs[d]
 
         # Apply pending garbage
         if self.pending_garbage > 0:
@@ -448,33 +577,44 @@ class MobileOnlineBattleGame:
         if not self.current_block:
             return
 
-        old_rotation = self.current_block.rotation
+        block = self.current_block
+        old_rotation = block.rotation
         if clockwise:
-            self.current_block.rotation = (self.current_block.rotation + 1) % len(self.current_block.shape)
+            block.rotation = (block.rotation + 1) % len(block.shape)
         else:
-            self.current_block.rotation = (self.current_block.rotation - 1) % len(self.current_block.shape)
-
-        # Wall kick offsets
-        kick_offsets = [(0, 0), (-1, 0), (1, 0), (0, -1), (-2, 0), (2, 0)]
-
-        for dx, dy in kick_offsets:
-            self.current_block.x += dx
-            self.current_block.y += dy
-            if self.board.is_valid_position(self.current_block):
+            block.rotation = (block.rotation - 1) % len(block.shape)
+
+        # Compute the rotated cell list once and test each wall-kick offset
+        # with inline bounds/collision checks, instead of mutating the
+        # block and rebuilding its cells per candidate
+        cells = block.get_cells()
+        grid = self.board.grid
+        width = self.board.width
+        height = self.board.height
+        for dx, dy in ((0, 0), (-1, 0), (1, 0), (0, -1), (-2, 0), (2, 0)):
+            for x, y in cells:
+                x += dx
+                y += dy
+                if x < 0 or x >= width or y >= height or (
+                        y >= 0 and grid[y][x] is not None):
+                    break
+            else:
+                block.x += dx
+                block.y += dy
                 return
-            self.current_block.x -= dx
-            self.current_block.y -= dy
 
-        self.current_block.rotation = old_rotation
+        block.rotation = old_rotation
 
     def _hard_drop(self):
         """Hard drop current block."""
         if not self.current_block:
             return
 
-        drop_distance = 0
-        while self._move(0, 1):
-            drop_distance += 1
+        # Ask the board for the landing row directly instead of probing
+        # one _move call (with its debuff and ground-state handling) per row
+        drop_distance = max(
+            0, self.board.get_drop_position(self.current_block) - self.current_block.y)
+        self.current_block.y += drop_distance
 
         self.score += drop_distance * SCORE_HARD_DROP
         self._lock_block()
@@ -502,7 +642,7 @@ class MobileOnlineBattleGame:
 
         powerup = self.powerups.pop(0)
         duration = BATTLE_POWERUP_DURATION.get(powerup, 5.0)
-        asyncio.create_task(self.network.send_debuff(powerup.value, duration))
+        self._outgoing.append(self._send_debuff(powerup.value, duration))
         logger.info(f"Sent debuff {powerup.value} to opponent")
 
     def _lock_block(self):
@@ -515,9 +655,14 @@ class MobileOnlineBattleGame:
             if 0 <= cell_y < self.board.height and 0 <= cell_x < self.board.width:
                 self.board.grid[cell_y][cell_x] = self.current_block.color
 
+        # The locked block's last reference is dropped when _spawn_block
+        # replaces current_block below, so it can rejoin the pool now
+        self._release_piece(self.current_block)
+
         # Clear lines
         lines_cleared = self.board.clear_lines()
         self.lines += lines_cleared
+        self._grid_rev += 1
 
         # Score
         score_table = {1: SCORE_SINGLE_LINE, 2: SCORE_DOUBLE_LINE, 3: SCORE_TRIPLE_LINE, 4: SCORE_QUAD_LINE}
@@ -529,25 +674,29 @@ class MobileOnlineBattleGame:
         # Send garbage to opponent
         if lines_cleared >= 2:
             garbage_to_send = lines_cleared - 1
-            asyncio.create_task(self.network.send_garbage(garbage_to_send))
+            self._outgoing.append(self._send_garbage(garbage_to_send))
 
         # Spawn next block
         if not self._spawn_block():
-            asyncio.create_task(self.network.send_game_over())
+            self._outgoing.append(self._send_game_over())
             self._end_game()
 
     def _add_garbage_lines(self, count: int):
         """Add garbage lines from bottom."""
-        for _ in range(count):
-            # Move all rows up
-            for y in range(1, self.board.height):
-                self.board.grid[y - 1] = self.board.grid[y][:]
+        grid = self.board.grid
+        width = self.board.width
+        count = min(count, self.board.height)
+
+        # Shift all surviving rows up in one slice operation instead of
+        # count * height individual row copies
+        del grid[:count]
 
-            # Create garbage line with random gap
-            gap = random.randint(0, self.board.width - 1)
-            garbage_row = [(128, 128, 128)] * self.board.width
-            garbage_row[gap] = None
-            self.board.grid[self.board.height - 1] = garbage_row
+        # Append garbage lines, each with one random gap
+        for _ in range(count):
+            garbage_row = [(128, 128, 128)] * width
+            garbage_row[random.randint(0, width - 1)] = None
+            grid.append(garbage_row)
+        self._grid_rev += 1
 
     def _end_game(self):
         """End the game."""
@@ -555,6 +704,12 @@ class MobileOnlineBattleGame:
         if not self.game_result:
             self.game_result = {'winner': 0, 'reason': 'TIMEOUT'}
 
+    @staticmethod
+    async def _flush_outgoing(batch):
+        """Await this frame's queued sends in order on one task."""
+        for send in batch:
+            await send
+
     async def _sync_state(self):
         """Send state to server."""
         if self.state != GameState.PLAYING:
@@ -564,7 +719,16 @@ class MobileOnlineBattleGame:
         if self._sync_counter % 3 != 0:
             return
 
-        await self.network.send_state(
+        # Skip the send entirely when nothing observable changed since the
+        # last sync (no piece movement, no lock, no score change)
+        block = self.current_block
+        piece_sig = (id(block.shape), block.x, block.y, block.rotation) if block else None
+        sig = (self._grid_rev, self.score, self.lines, piece_sig)
+        if sig == self._last_sync_sig:
+            return
+        self._last_sync_sig = sig
+
+        await self._send_state(
             grid=self.board.grid,
             score=self.score,
             lines=self.lines,
@@ -573,14 +737,33 @@ class MobileOnlineBattleGame:
 
     def _render(self):
         """Render the game."""
-        self.screen.fill(COLOR_WHITE)
-
         if self.waiting_for_match:
             self._draw_waiting_screen()
-        elif self.state == GameState.PLAYING or self.state == GameState.GAME_OVER:
+            self._needs_full_flip = True
+            return
+
+        # No screen.fill here: _draw_game starts by blitting the full-window
+        # background surface, so a white pre-fill is a wasted memset
+        if self.state == GameState.PLAYING or self.state == GameState.GAME_OVER:
             self._draw_game()
 
-        pygame.display.flip()
+        if self.state == GameState.GAME_OVER or self._needs_full_flip:
+            # Full-window overlay, or first frame after a transition
+            pygame.display.flip()
+            self._needs_full_flip = False
+            self._last_touch_state = None
+            return
+
+        # Partial update: the status bar and play field change every frame;
+        # include the touch strip only when its visual state changed
+        dirty = [self._bar_rect, self._play_rect]
+        touch_state = (tuple(b.is_pressed for b in self.touch_controls.buttons),
+                       self.touch_controls.left_pressed,
+                       self.touch_controls.right_pressed)
+        if touch_state != self._last_touch_state:
+            dirty.append(self._touch_rect)
+            self._last_touch_state = touch_state
+        pygame.display.update(dirty)
 
     def _draw_waiting_screen(self):
         """Draw waiting for opponent screen."""
@@ -628,8 +811,10 @@ class MobileOnlineBattleGame:
         if self.powerups:
             self._draw_powerups(board_end_x)
 
-        # 4. Draw debuff effects on board
-        self._draw_debuff_effects(board_offset_y)
+        # 4. Draw debuff effects on board (skip the call in the common
+        # no-debuff steady state)
+        if self.active_debuffs:
+            self._draw_debuff_effects(board_offset_y)
 
         # 5. Draw touch controls
         self.touch_controls.draw(self.screen, self.font_small)
@@ -651,19 +836,15 @@ class MobileOnlineBattleGame:
         pygame.draw.rect(self.screen, (50, 50, 60), (ui_x, stats_y, panel_width, panel_height), border_radius=8)
         pygame.draw.rect(self.screen, (100, 100, 120), (ui_x, stats_y, panel_width, panel_height), 2, border_radius=8)
 
-        # Score (large)
-        score_text = f"Score: {self.score}"
-        score_surface = self.font_medium.render(score_text, True, COLOR_WHITE)
-        self.screen.blit(score_surface, (ui_x + 10, stats_y + 15))
-
-        # Level and Lines (smaller, side by side)
-        level_text = f"Lv.{self.level}"
-        level_surface = self.font_small.render(level_text, True, (200, 200, 200))
-        self.screen.blit(level_surface, (ui_x + 10, stats_y + 55))
-
-        lines_text = f"Lines: {self.lines}"
-        lines_surface = self.font_small.render(lines_text, True, (200, 200, 200))
-        self.screen.blit(lines_surface, (ui_x + 10, stats_y + 85))
+        # Score (large), level and lines (smaller) in one batched blit call
+        self.screen.blits((
+            (self._text(self.font_medium, f"Score: {self.score}", COLOR_WHITE),
+             (ui_x + 10, stats_y + 15)),
+            (self._text(self.font_small, f"Lv.{self.level}", (200, 200, 200)),
+             (ui_x + 10, stats_y + 55)),
+            (self._text(self.font_small, f"Lines: {self.lines}", (200, 200, 200)),
+             (ui_x + 10, stats_y + 85)),
+        ), doreturn=0)
 
     def _draw_opponent_status_bar(self):
         """Draw opponent status bar at top of screen."""
@@ -676,36 +857,36 @@ class MobileOnlineBattleGame:
         # Timer (center)
         minutes = int(self.time_remaining) // 60
         seconds = int(self.time_remaining) % 60
-        timer_text = f"{minutes:02d}:{seconds:02d}"
-        timer_surface = self.font_large.render(timer_text, True, COLOR_WHITE)
+        timer_surface = self._text(self.font_large, f"{minutes:02d}:{seconds:02d}", COLOR_WHITE)
         timer_rect = timer_surface.get_rect(center=(WINDOW_WIDTH // 2, bar_height // 2))
-        self.screen.blit(timer_surface, timer_rect)
 
-        # Opponent info (left)
-        vs_text = f"VS {self.opponent_name}"
-        vs_surface = self.font_small.render(vs_text, True, COLOR_WHITE)
-        self.screen.blit(vs_surface, (10, 8))
-
-        score_text = f"{self.opponent_score} pts | {self.opponent_lines} lines"
-        score_surface = self.font_small.render(score_text, True, (200, 200, 200))
-        self.screen.blit(score_surface, (10, 32))
+        # Collect all bar text into one batched blit call
+        blit_list = [
+            (timer_surface, timer_rect),
+            # Opponent info (left)
+            (self._text(self.font_small, f"VS {self.opponent_name}", COLOR_WHITE), (10, 8)),
+            (self._text(self.font_small,
+                        f"{self.opponent_score} pts | {self.opponent_lines} lines",
+                        (200, 200, 200)), (10, 32)),
+        ]
 
         # Garbage warning (right side, flashing)
         if self.pending_garbage > 0:
-            flash = (time.time() - self.garbage_warning_flash) % 0.5 < 0.25
+            flash = (time.monotonic() - self.garbage_warning_flash) % 0.5 < 0.25
             warn_color = (255, 100, 100) if flash else (200, 50, 50)
-            warn_text = f"+{self.pending_garbage}"
-            warn_surface = self.font_medium.render(warn_text, True, warn_color)
+            warn_surface = self._text(self.font_medium, f"+{self.pending_garbage}", warn_color)
             warn_rect = warn_surface.get_rect(right=WINDOW_WIDTH - 15, centery=bar_height // 2)
-            self.screen.blit(warn_surface, warn_rect)
+            blit_list.append((warn_surface, warn_rect))
 
-            # Warning icon
+            # Warning icon (shape draw, before the text pass)
             pygame.draw.polygon(self.screen, warn_color, [
                 (warn_rect.left - 25, bar_height // 2 - 12),
                 (warn_rect.left - 5, bar_height // 2 - 12),
                 (warn_rect.left - 15, bar_height // 2 + 12)
             ])
 
+        self.screen.blits(blit_list, doreturn=0)
+
     def _draw_powerups(self, board_end_x: int):
         """Draw powerup inventory."""
         # Position below stats panel
@@ -718,19 +899,16 @@ class MobileOnlineBattleGame:
         pygame.draw.rect(self.screen, (50, 50, 60), (panel_x, panel_y, panel_width, panel_height), border_radius=8)
         pygame.draw.rect(self.screen, (100, 100, 120), (panel_x, panel_y, panel_width, panel_height), 2, border_radius=8)
 
-        # Title
-        title = self.font_small.render("POWER-UP", True, COLOR_WHITE)
-        self.screen.blit(title, (panel_x + 10, panel_y + 5))
-
-        # Powerup icons/names
+        # Title, powerup names and hint in one batched blit call
+        blit_list = [(self._text(self.font_small, "POWER-UP", COLOR_WHITE),
+                      (panel_x + 10, panel_y + 5))]
         for i, powerup in enumerate(self.powerups[:2]):
             name = powerup.value[:3].upper()
-            text = self.font_small.render(name, True, (255, 200, 100))
-            self.screen.blit(text, (panel_x + 15 + i * 50, panel_y + 35))
-
-        # Hint
-        hint = self.font_small.render("[PWR]", True, (150, 150, 150))
-        self.screen.blit(hint, (panel_x + 25, panel_y + 48))
+            blit_list.append((self._text(self.font_small, name, (255, 200, 100)),
+                              (panel_x + 15 + i * 50, panel_y + 35)))
+        blit_list.append((self._text(self.font_small, "[PWR]", (150, 150, 150)),
+                          (panel_x + 25, panel_y + 48)))
+        self.screen.blits(blit_list, doreturn=0)
 
     def _draw_debuff_effects(self, offset_y: int):
         """Draw visual debuff effects on the game board."""
@@ -742,28 +920,29 @@ class MobileOnlineBattleGame:
         # Ink effect - dark overlay on bottom 2/3
         if BattlePowerUpType.INK in self.active_debuffs:
             ink_height = int(board_height * 0.67)
-            ink_surface = pygame.Surface((board_width, ink_height))
-            ink_surface.fill((5, 5, 10))
-            ink_surface.set_alpha(240)
+            ink_surface = self._ink_overlay_cache.get((board_width, ink_height))
+            if ink_surface is None:
+                ink_surface = pygame.Surface((board_width, ink_height)).convert()
+                ink_surface.fill((5, 5, 10))
+                ink_surface.set_alpha(240)
+                self._ink_overlay_cache[(board_width, ink_height)] = ink_surface
             self.screen.blit(ink_surface, (offset_x, offset_y + board_height - ink_height))
 
-        # Draw active debuff icons below powerup panel
-        if self.active_debuffs:
-            board_end_x = offset_x + board_width + 10
-            debuff_y = 520
-            debuff_x = board_end_x + 15
-            label = self.font_small.render("DEBUFF", True, COLOR_RED)
-            self.screen.blit(label, (debuff_x, debuff_y))
-            for i, debuff in enumerate(self.active_debuffs.keys()):
-                text = self.font_small.render(debuff.value[:3].upper(), True, COLOR_RED)
-                self.screen.blit(text, (debuff_x, debuff_y + 20 + i * 18))
+        # Draw active debuff icons below powerup panel (one batched blit
+        # call; the caller only invokes this when debuffs are active)
+        board_end_x = offset_x + board_width + 10
+        debuff_y = 520
+        debuff_x = board_end_x + 15
+        blit_list = [(self._text(self.font_small, "DEBUFF", COLOR_RED),
+                      (debuff_x, debuff_y))]
+        for i, debuff in enumerate(self.active_debuffs.keys()):
+            blit_list.append((self._text(self.font_small, debuff.value[:3].upper(), COLOR_RED),
+                              (debuff_x, debuff_y + 20 + i * 18)))
+        self.screen.blits(blit_list, doreturn=0)
 
     def _draw_game_over(self):
         """Draw game over overlay."""
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._gameover_overlay, (0, 0))
 
         if not self.game_result:
             return
@@ -782,7 +961,7 @@ class MobileOnlineBattleGame:
             result_text = "YOU LOSE"
             color = (200, 50, 50)
 
-        text = self.font_large.render(result_text, True, color)
+        text = self._text(self.font_large, result_text, color)
         rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
         self.screen.blit(text, rect)
 
@@ -794,24 +973,24 @@ class MobileOnlineBattleGame:
         }
         reason_str = reason_texts.get(reason, '')
         if reason_str:
-            sub_text = self.font_medium.render(reason_str, True, COLOR_WHITE)
+            sub_text = self._text(self.font_medium, reason_str, COLOR_WHITE)
             sub_rect = sub_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
             self.screen.blit(sub_text, sub_rect)
 
         # Score
         score_text = f"Your Score: {self.score}"
-        score_surface = self.font_small.render(score_text, True, COLOR_WHITE)
+        score_surface = self._text(self.font_small, score_text, COLOR_WHITE)
         score_rect = score_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
         self.screen.blit(score_surface, score_rect)
 
-        hint = self.font_small.render("Press ESC to return to menu", True, COLOR_WHITE)
+        hint = self._text(self.font_small, "Press ESC to return to menu", COLOR_WHITE)
         hint_rect = hint.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 100))
         self.screen.blit(hint, hint_rect)
 
     async def _show_error_screen(self):
         """Show connection error screen."""
-        error_start = time.time()
-        while time.time() - error_start < 3:
+        error_start = time.monotonic()
+        while time.monotonic() - error_start < 3:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
                     return
@@ -8,6 +8,22 @@ import asyncio
 import json
 import sys
 import logging
+from collections import deque
+
+# Prefer orjson for JSON decode/encode when installed (2-5x faster than
+# stdlib json); fall back silently since it is an optional dependency.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,6 +35,20 @@ IS_WEB = sys.platform == "emscripten"
 if IS_WEB:
     from platform import window
 
+# One JS round trip per poll tick: drain every queued message and report
+# the connection flag together, instead of one eval per message plus a
+# second eval for the status check
+_RECEIVE_POLL_JS = """
+(function() {
+    var msgs = window._tetris_ws_messages;
+    var out = {c: !!window._tetris_ws_connected, m: []};
+    if (msgs && msgs.length > 0) {
+        out.m = msgs.splice(0, msgs.length);
+    }
+    return JSON.stringify(out);
+})()
+"""
+
 
 class NetworkManager:
     """Handles WebSocket communication for online battle mode."""
@@ -26,16 +56,42 @@ class NetworkManager:
     # Default server URL (override with connect())
     DEFAULT_URL = "wss://tetris-online.jefferysung860629.workers.dev/ws"
 
+    # Cap on queued non-STATE events; oldest are dropped past this
+    MAX_QUEUED_EVENTS = 256
+
     def __init__(self):
         self.websocket = None
         self.connected = False
-        self.message_queue = asyncio.Queue()
+
+        # Inbound events as a plain deque polled by the game loop; a
+        # deque append/popleft is far cheaper than asyncio.Queue's
+        # lock + waiter bookkeeping for this single-consumer pattern.
+        # Bounded so a server burst against a stalled game loop cannot
+        # grow memory without limit; STATE frames are coalesced into
+        # _latest_state instead, since only the newest one matters.
+        self._events = deque()
+        self._latest_state = None
         self.role = None  # 1 or 2, assigned by server
         self.game_id = None
         self.opponent_name = None
         self.server_time_offset = 0  # For time sync
         self._js_ws = None  # JavaScript WebSocket reference (web only)
 
+        # Palette of colors seen in outgoing grids; cells are sent as
+        # 1-based palette ids instead of per-cell [r, g, b] lists
+        self._color_palette = {}
+
+        # Last grid (as palette ids) for diff-only state sends, with a
+        # periodic full keyframe so a lost diff cannot desync forever
+        self._last_grid_ids = None
+        self._sends_since_keyframe = 0
+
+        # Outbound queue drained by a single writer task, so send() is a
+        # cheap enqueue and consecutive messages go out back-to-back
+        self._send_queue = deque()
+        self._send_wakeup = None
+        self._writer_task = None
+
     async def connect(self, uri: str = None):
         """Connect to the WebSocket server."""
         uri = uri or self.DEFAULT_URL
@@ -77,6 +133,14 @@ class NetworkManager:
                     console.log("WebSocket closed");
                 }};
 
+                window._tetris_ws_send = function(s) {{
+                    if (window._tetris_ws && window._tetris_ws.readyState === 1) {{
+                        window._tetris_ws.send(s);
+                        return true;
+                    }}
+                    return false;
+                }};
+
                 return "ok";
             }})()
             """
@@ -88,8 +152,9 @@ class NetworkManager:
                 if window.eval("window._tetris_ws_connected"):
                     self.connected = True
                     logger.info("[Web] Connected!")
-                    # Start receive loop
+                    # Start receive and writer loops
                     asyncio.create_task(self._receive_loop_web())
+                    self._writer_task = asyncio.create_task(self._writer_loop())
                     return True
                 if window.eval("window._tetris_ws_error"):
                     error = window.eval("window._tetris_ws_error")
@@ -108,12 +173,16 @@ class NetworkManager:
         try:
             import websockets
             logger.info(f"[Desktop] Connecting to {uri}...")
-            self.websocket = await websockets.connect(uri)
+            # Payloads are small and frequent: cap frame size and skip
+            # per-message deflate, which costs more than it saves here
+            self.websocket = await websockets.connect(
+                uri, max_size=2 ** 20, compression=None)
             self.connected = True
             logger.info("[Desktop] Connected!")
 
-            # Start receive loop
+            # Start receive and writer loops
             asyncio.create_task(self._receive_loop_desktop())
+            self._writer_task = asyncio.create_task(self._writer_loop())
             return True
 
         except ImportError:
@@ -125,26 +194,20 @@ class NetworkManager:
             return False
 
     async def _receive_loop_web(self):
-        """Listen for incoming messages (web version)."""
+        """Listen for incoming messages (web version).
+
+        Pygbag's JS bridge cannot call back into Python from onmessage,
+        so this stays a poll loop — but each tick is a single eval that
+        drains the whole JS-side message array at once.
+        """
         try:
             while self.connected:
-                # Check for new messages from JavaScript queue
-                js_code = """
-                (function() {
-                    if (window._tetris_ws_messages && window._tetris_ws_messages.length > 0) {
-                        return window._tetris_ws_messages.shift();
-                    }
-                    return null;
-                })()
-                """
-                message = window.eval(js_code)
+                result = _loads(window.eval(_RECEIVE_POLL_JS))
 
-                if message:
-                    data = json.loads(message)
-                    await self.message_queue.put(data)
+                for message in result["m"]:
+                    self._enqueue_event(_loads(message))
 
-                # Check connection status
-                if not window.eval("window._tetris_ws_connected"):
+                if not result["c"]:
                     self.connected = False
                     break
 
@@ -158,46 +221,117 @@ class NetworkManager:
         """Listen for incoming messages (desktop version)."""
         try:
             async for message in self.websocket:
-                data = json.loads(message)
-                await self.message_queue.put(data)
+                self._enqueue_event(_loads(message))
         except Exception as e:
             logger.error(f"[Desktop] Connection lost: {e}")
             self.connected = False
 
+    def _enqueue_event(self, data):
+        """Queue one decoded message for the game loop.
+
+        STATE frames overwrite each other — the opponent's latest board
+        snapshot supersedes any older one — so a slow frame never piles
+        up stale grids. Everything else (GARBAGE, DEBUFF, GAME_OVER,
+        match events) is order-sensitive and goes through the bounded
+        deque, dropping the oldest entry past the cap.
+        """
+        if data.get("type") == "STATE":
+            pending = self._latest_state
+            if pending is None:
+                self._latest_state = data
+            else:
+                self._merge_state(pending, data)
+            return
+
+        if len(self._events) >= self.MAX_QUEUED_EVENTS:
+            self._events.popleft()
+            logger.warning("Event queue full; dropped oldest message")
+        self._events.append(data)
+
+    @staticmethod
+    def _merge_state(pending, new):
+        """Fold a newer STATE frame into the pending one.
+
+        Diff frames cannot simply be dropped — grid_diff entries apply
+        on top of the previous frame and palette_delta entries must be
+        seen in order — so merge instead: a full grid supersedes the
+        pending board, diffs are applied or concatenated, and palette
+        deltas accumulate.
+        """
+        if "palette_delta" in new:
+            if "palette_delta" in pending:
+                pending["palette_delta"].extend(new["palette_delta"])
+            else:
+                pending["palette_delta"] = new["palette_delta"]
+        if "grid" in new:
+            pending.pop("grid_diff", None)
+            pending["grid"] = new["grid"]
+        elif "grid_diff" in new:
+            if "grid" in pending:
+                grid = pending["grid"]
+                for row, col, cell_id in new["grid_diff"]:
+                    grid[row][col] = cell_id
+            elif "grid_diff" in pending:
+                pending["grid_diff"].extend(new["grid_diff"])
+            else:
+                pending["grid_diff"] = new["grid_diff"]
+        pending["score"] = new["score"]
+        pending["lines"] = new["lines"]
+        if "piece" in new:
+            pending["piece"] = new["piece"]
+
     async def get_event(self):
         """Get the next event from the queue (non-blocking)."""
-        if self.message_queue.empty():
-            return None
-        return await self.message_queue.get()
+        return self.try_get_event()
+
+    def try_get_event(self):
+        """Get the next event from the queue without awaiting.
+
+        Returns:
+            The next event dict, or None if the queue is empty
+        """
+        if self._events:
+            return self._events.popleft()
+        state = self._latest_state
+        if state is not None:
+            self._latest_state = None
+            return state
+        return None
 
     async def send(self, data: dict):
-        """Send data to the server."""
+        """Queue data for the writer task to send to the server."""
         if not self.connected:
             return False
 
-        try:
-            message = json.dumps(data)
-
-            if IS_WEB:
-                # Send via JavaScript WebSocket
-                js_code = f"""
-                (function() {{
-                    if (window._tetris_ws && window._tetris_ws.readyState === WebSocket.OPEN) {{
-                        window._tetris_ws.send('{message.replace("'", "\\'")}');
-                        return true;
-                    }}
-                    return false;
-                }})()
-                """
-                return window.eval(js_code)
-            else:
-                await self.websocket.send(message)
-                return True
+        self._send_queue.append(data)
+        wakeup = self._send_wakeup
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+        return True
 
+    async def _writer_loop(self):
+        """Drain queued messages onto the socket on one long-lived task."""
+        try:
+            while self.connected:
+                if not self._send_queue:
+                    self._send_wakeup = asyncio.get_running_loop().create_future()
+                    await self._send_wakeup
+                    continue
+                await self._send_raw(_dumps(self._send_queue.popleft()))
         except Exception as e:
             logger.error(f"Send failed: {e}")
             self.connected = False
-            return False
+
+    async def _send_raw(self, message: str):
+        """Write one serialized message to the underlying WebSocket."""
+        if IS_WEB:
+            # Call the helper installed at connect time through Pygbag's
+            # window binding: the payload is passed as a real JS string
+            # argument, so there is no per-send source interpolation,
+            # eval parse, or escaping to get wrong
+            window._tetris_ws_send(message)
+        else:
+            await self.websocket.send(message)
 
     async def join_matchmaking(self, player_name: str = "Player"):
         """Join the matchmaking queue."""
@@ -214,13 +348,54 @@ class NetworkManager:
             "lines": lines,
         }
 
-        # Serialize grid: None -> 0, (r,g,b) -> [r,g,b]
+        # Serialize grid as small ints: 0 = empty, otherwise a 1-based id
+        # into the palette of colors seen so far. New colors ride along in
+        # palette_delta the first time they appear, so steady-state frames
+        # carry no per-cell lists at all.
         if grid:
+            palette = self._color_palette
+            new_colors = []
             simple_grid = []
             for row in grid:
-                simple_row = [list(cell) if cell else 0 for cell in row]
-                simple_grid.append(simple_row)
-            payload["grid"] = simple_grid
+                ids = []
+                append = ids.append
+                for cell in row:
+                    if cell is None:
+                        append(0)
+                        continue
+                    cid = palette.get(cell)
+                    if cid is None:
+                        cid = len(palette) + 1
+                        palette[cell] = cid
+                        new_colors.append(list(cell))
+                    append(cid)
+                simple_grid.append(ids)
+
+            # Send only changed cells as [row, col, id] triples; fall back
+            # to a full grid on the first send, every 120 sends, or when
+            # more than ~30% of the board changed at once
+            last = self._last_grid_ids
+            self._sends_since_keyframe += 1
+            if (last is None or len(last) != len(simple_grid)
+                    or self._sends_since_keyframe > 120):
+                payload["grid"] = simple_grid
+                self._sends_since_keyframe = 0
+            else:
+                diffs = []
+                for r, (old_row, new_row) in enumerate(zip(last, simple_grid)):
+                    if old_row != new_row:
+                        for c, (old_id, new_id) in enumerate(zip(old_row, new_row)):
+                            if old_id != new_id:
+                                diffs.append((r, c, new_id))
+                if len(diffs) * 10 > 3 * len(simple_grid) * len(simple_grid[0]):
+                    payload["grid"] = simple_grid
+                    self._sends_since_keyframe = 0
+                elif diffs:
+                    payload["grid_diff"] = diffs
+            self._last_grid_ids = simple_grid
+
+            if new_colors:
+                payload["palette_delta"] = new_colors
 
         # Serialize current piece with shape for rendering
         if piece:
@@ -261,6 +436,11 @@ class NetworkManager:
         """Close the WebSocket connection."""
         self.connected = False
 
+        # Wake the writer task so it observes the disconnect and exits
+        wakeup = self._send_wakeup
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
         if IS_WEB:
             try:
                 window.eval("""
@@ -47,6 +47,10 @@ class OnlineBattleGame(BattleGame):
         # Sync counter for throttling state updates
         self._sync_counter = 0
 
+        # Accumulated palette for decoding the opponent's grid cells,
+        # which arrive as 1-based palette ids plus palette_delta entries
+        self._opponent_palette = []
+
         # Server time tracking
         self.server_time_remaining = BATTLE_DURATION
 
@@ -338,14 +342,36 @@ class OnlineBattleGame(BattleGame):
         """Update remote player's state from network data."""
         remote_player = self.player2 if self.local_role == 1 else self.player1
 
-        # Update grid
+        # Update grid (cells are palette ids; lists are accepted too for
+        # peers still sending the old per-cell [r, g, b] format)
+        if 'palette_delta' in data:
+            self._opponent_palette.extend(
+                tuple(color) for color in data['palette_delta'])
+        palette = self._opponent_palette
+        palette_size = len(palette)
+
         if 'grid' in data:
+            # Full keyframe
+            grid = remote_player.board.grid
             for y, row in enumerate(data['grid']):
+                grid_row = grid[y]
                 for x, cell in enumerate(row):
                     if cell == 0:
-                        remote_player.board.grid[y][x] = None
+                        grid_row[x] = None
+                    elif isinstance(cell, int):
+                        grid_row[x] = (palette[cell - 1]
+                                       if cell <= palette_size else (128, 128, 128))
                     else:
-                        remote_player.board.grid[y][x] = tuple(cell)
+                        grid_row[x] = tuple(cell)
+        elif 'grid_diff' in data:
+            # Only the changed cells since the previous state message
+            grid = remote_player.board.grid
+            for y, x, cell in data['grid_diff']:
+                if cell == 0:
+                    grid[y][x] = None
+                else:
+                    grid[y][x] = (palette[cell - 1]
+                                  if cell <= palette_size else (128, 128, 128))
 
         # Update stats
         remote_player.score = data.get('score', remote_player.score)
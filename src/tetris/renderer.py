@@ -11,17 +11,35 @@ from .constants import (
     COLOR_WHITE, COLOR_BLACK, COLOR_DARK_GRAY,
     COLOR_LIGHT_GRAY, COLOR_GRAY, COLOR_BOARD_BG, COLOR_BUTTON_NORMAL,
     COLOR_BUTTON_HOVER, COLOR_YELLOW, COLOR_GREEN,
-    GameState
+    GameState, PowerUpType
 )
 
+# Short power-up labels for inventory slots, hoisted out of the per-frame
+# draw_powerup_inventory call
+_POWERUP_SHORT_NAMES = {
+    PowerUpType.BOMB: "BOMB",
+    PowerUpType.MAGNET: "MAGN",
+    PowerUpType.TIME_FREEZE: "FRZE",
+    PowerUpType.GRAVITY_REVERSE: "GRAV",
+    PowerUpType.LINE_ERASER: "ERAS",
+    PowerUpType.GHOST_MODE: "GHST",
+}
+
 
 class Renderer:
     """Handles all game rendering using Pygame with a cute aesthetic."""
 
-    def __init__(self):
-        """Initialize Pygame and create window."""
+    def __init__(self, display_flags: int = 0):
+        """Initialize Pygame and create window.
+
+        Args:
+            display_flags: Optional pygame display flags (e.g. SCALED |
+                DOUBLEBUF) so callers that pre-configure the display mode
+                don't get it clobbered by this set_mode call
+        """
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.screen = pygame.display.set_mode(
+            (WINDOW_WIDTH, WINDOW_HEIGHT), display_flags)
         pygame.display.set_caption("Claire's Tetris 💖")
 
         # Dynamic cell size (can be adjusted for different board sizes)
@@ -51,6 +69,16 @@ class Renderer:
         self.bg_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         self._fill_gradient(self.bg_surface, COLOR_BG_TOP, COLOR_BG_BOTTOM)
 
+        # Full-screen dim overlays, prebuilt with per-pixel alpha and
+        # convert_alpha() so each blit takes SDL's fast alpha-blend path
+        # instead of re-allocating a per-surface-alpha overlay every frame
+        self._dark_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self._dark_overlay.fill((0, 0, 0, 220))
+        self._dark_overlay = self._dark_overlay.convert_alpha()
+        self._pause_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self._pause_overlay.fill((*COLOR_BACKGROUND, 150))
+        self._pause_overlay = self._pause_overlay.convert_alpha()
+
     def _fill_gradient(self, surface: pygame.Surface, top_color: Tuple[int, int, int], bottom_color: Tuple[int, int, int]) -> None:
         """Fill surface with vertical gradient."""
         height = surface.get_height()
@@ -66,8 +94,14 @@ class Renderer:
         pygame.draw.rect(surface, color, rect, width, border_radius=radius)
 
     def draw_cell(self, x: int, y: int, color: Tuple[int, int, int],
-                  offset_x: int = 0, offset_y: int = 0, alpha: int = 255) -> None:
-        """Draw a single cell (block) with classic Tetris style."""
+                  offset_x: int = 0, offset_y: int = 0, alpha: int = 255,
+                  surface: Optional[pygame.Surface] = None) -> None:
+        """Draw a single cell (block) with classic Tetris style.
+
+        Args:
+            surface: Target surface (defaults to the screen)
+        """
+        target = surface if surface is not None else self.screen
         cs = self.cell_size  # Use dynamic cell size
 
         # Pixel coordinates
@@ -87,22 +121,22 @@ class Renderer:
             # Outline with slightly higher opacity
             pygame.draw.rect(ghost_surface, (*color, 120), (1, 1, cs - 2, cs - 2), 2, border_radius=4)
 
-            self.screen.blit(ghost_surface, (px, py))
+            target.blit(ghost_surface, (px, py))
         else:
             # Solid block with "Macaron" style (softer, less harsh 3D)
             # Fill main color
-            pygame.draw.rect(self.screen, color, rect, border_radius=4)
+            pygame.draw.rect(target, color, rect, border_radius=4)
 
             # Subtle highlight (top-left)
             highlight = (min(255, color[0] + 40), min(255, color[1] + 40), min(255, color[2] + 40))
             # Draw a soft rounded highlight instead of harsh lines
-            pygame.draw.line(self.screen, highlight, (px + 4, py + 4), (px + cs - 6, py + 4), 2)
-            pygame.draw.line(self.screen, highlight, (px + 4, py + 4), (px + 4, py + cs - 6), 2)
+            pygame.draw.line(target, highlight, (px + 4, py + 4), (px + cs - 6, py + 4), 2)
+            pygame.draw.line(target, highlight, (px + 4, py + 4), (px + 4, py + cs - 6), 2)
 
             # Subtle shadow (bottom-right) - reduced intensity
             shadow = (max(0, color[0] - 30), max(0, color[1] - 30), max(0, color[2] - 30))
-            pygame.draw.line(self.screen, shadow, (px + 4, py + cs - 4), (px + cs - 4, py + cs - 4), 2)
-            pygame.draw.line(self.screen, shadow, (px + cs - 4, py + 4), (px + cs - 4, py + cs - 4), 2)
+            pygame.draw.line(target, shadow, (px + 4, py + cs - 4), (px + cs - 4, py + cs - 4), 2)
+            pygame.draw.line(target, shadow, (px + cs - 4, py + 4), (px + cs - 4, py + cs - 4), 2)
 
             # No black border for softer look
             # pygame.draw.rect(self.screen, (0, 0, 0), (px, py, cs, cs), 1)
@@ -141,6 +175,49 @@ class Renderer:
                 if color:
                     self.draw_cell(x, y, color, offset_x, offset_y)
 
+    def create_board_surface(self, board: Board) -> pygame.Surface:
+        """Create a surface sized for the board container (including border padding).
+
+        Args:
+            board: Board to size the surface for
+
+        Returns:
+            Transparent surface ready for render_board_to_surface()
+        """
+        cs = self.cell_size
+        return pygame.Surface((board.width * cs + 10, board.height * cs + 10), pygame.SRCALPHA)
+
+    def render_board_to_surface(self, board: Board, surface: pygame.Surface) -> None:
+        """Render the static board (background, grid dots, placed blocks) to a surface.
+
+        Used by the game loop's dirty-flag cache: the cached surface is blitted
+        every frame and only rebuilt when the board contents actually change,
+        so the per-frame cost drops from width*height cell draws to one blit.
+
+        Args:
+            board: Board to render
+            surface: Target surface created by create_board_surface()
+        """
+        cs = self.cell_size
+        surface.fill((0, 0, 0, 0))
+
+        # Semi-transparent white background with soft border
+        board_rect = surface.get_rect()
+        pygame.draw.rect(surface, (255, 255, 255, 180), board_rect, border_radius=10)
+        pygame.draw.rect(surface, COLOR_GRID_LINE, board_rect, 2, border_radius=10)
+
+        # Grid dots (offset by the 5px border padding)
+        for y in range(board.height + 1):
+            for x in range(board.width + 1):
+                pygame.draw.circle(surface, COLOR_GRID_LINE, (5 + x * cs, 5 + y * cs), 1)
+
+        # Placed blocks
+        for y in range(board.height):
+            for x in range(board.width):
+                color = board.get_cell(x, y)
+                if color:
+                    self.draw_cell(x, y, color, 5, 5, surface=surface)
+
     def draw_block(self, block: Block, offset_x: int = 50, offset_y: int = 50,
                    alpha: int = 255, is_powerup: bool = False) -> None:
         """Draw a falling block."""
@@ -323,15 +400,7 @@ class Renderer:
                 powerup = inventory[i]
                 pygame.draw.rect(self.screen, COLOR_BUTTON_NORMAL, slot_rect, 2, border_radius=10)
 
-                name_map = {
-                    "bomb": "BOMB",
-                    "rainbow": "RAIN",
-                    "time_freeze": "FRZE",
-                    "gravity_reverse": "GRAV",
-                    "line_eraser": "ERAS",
-                    "ghost_mode": "GHST"
-                }
-                name = name_map.get(powerup.type.value, powerup.type.value[:4].upper())
+                name = _POWERUP_SHORT_NAMES[powerup.type]
                 # Center text in larger slot (160x65)
                 self.draw_text(name, slot_x + slot_width // 2 - 20, slot_y + slot_height // 2 - 10,
                              self.font_small, COLOR_TEXT)
@@ -345,10 +414,7 @@ class Renderer:
     def draw_game_over_screen(self, score: int, lines: int, high_score: int) -> None:
         """Draw game over overlay with prominent popup."""
         # Dark overlay (more opaque)
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((0, 0, 0))  # Dark background
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dark_overlay, (0, 0))
 
         # Modal Box (larger and more prominent)
         box_width, box_height = 500, 420
@@ -463,10 +529,7 @@ class Renderer:
             player_id: Current player's ID to highlight
         """
         # Dark overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dark_overlay, (0, 0))
 
         # Modal box
         box_width, box_height = 600, 550
@@ -554,10 +617,7 @@ class Renderer:
 
     def draw_pause_screen(self) -> None:
         """Draw pause overlay."""
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill(COLOR_BACKGROUND)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
 
         self.draw_text("PAUSED", WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2,
                       self.font_medium, COLOR_TEXT, center=True, shadow=True)
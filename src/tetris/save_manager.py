@@ -124,6 +124,38 @@ class SaveManager:
 
         return newly_unlocked
 
+    def finalize_game(self, mode: str, score: int, lines: int) -> list[str]:
+        """Record a finished game's results with a single save write.
+
+        Fuses update_high_score + add_lines + check_and_unlock_modes,
+        which would otherwise each rewrite the save file.
+
+        Args:
+            mode: Game mode string
+            score: Final score
+            lines: Lines cleared this game
+
+        Returns:
+            List of newly unlocked mode strings
+        """
+        if score > self.get_high_score(mode):
+            self.data["high_scores"][mode] = score
+
+        if mode not in self.data["total_lines"]:
+            self.data["total_lines"][mode] = 0
+        self.data["total_lines"][mode] += lines
+
+        newly_unlocked = []
+        total_lines = self.get_total_lines()
+        for unlock_mode, required_lines in UNLOCK_REQUIREMENTS.items():
+            mode_str = unlock_mode.value
+            if total_lines >= required_lines and not self.is_mode_unlocked(mode_str):
+                self.data["unlocked_modes"].append(mode_str)
+                newly_unlocked.append(mode_str)
+
+        self.save()
+        return newly_unlocked
+
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
         return self.data["settings"].get(key, default)
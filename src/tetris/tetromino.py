@@ -1,14 +1,36 @@
 """Tetromino block definitions (7 standard 4-block shapes for Classic mode)."""
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from .constants import (
     COLOR_CYAN, COLOR_YELLOW, COLOR_PURPLE, COLOR_GREEN,
     COLOR_RED, COLOR_BLUE, COLOR_ORANGE
 )
 
+# Memoized filled-cell offsets per (shape, rotation). Shape matrices are
+# module-level constants, so keying by id() is stable; the shape reference is
+# stored in the value to keep it alive (and its id unique) for the cache's
+# lifetime. Saves re-scanning the rotation matrix on every collision probe.
+_CELL_OFFSET_CACHE: Dict[Tuple[int, int], Tuple[list, Tuple[Tuple[int, int], ...]]] = {}
 
-@dataclass
+
+def _cell_offsets(shape: List[List[int]], rotation: int) -> Tuple[Tuple[int, int], ...]:
+    """Get cached (col, row) offsets of filled cells for a rotation state."""
+    key = (id(shape), rotation)
+    cached = _CELL_OFFSET_CACHE.get(key)
+    if cached is None:
+        matrix = shape[rotation]
+        offsets = tuple(
+            (col_idx, row_idx)
+            for row_idx, row in enumerate(matrix)
+            for col_idx, cell in enumerate(row)
+            if cell
+        )
+        _CELL_OFFSET_CACHE[key] = cached = (shape, offsets)
+    return cached[1]
+
+
+@dataclass(slots=True)
 class Block:
     """Base block class representing a game piece."""
     shape: List[List[int]]  # Rotation states as 2D matrices
@@ -19,13 +41,9 @@ class Block:
 
     def get_cells(self) -> List[Tuple[int, int]]:
         """Get list of (x, y) coordinates of filled cells in current rotation."""
-        cells = []
-        current_shape = self.shape[self.rotation]
-        for row_idx, row in enumerate(current_shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    cells.append((self.x + col_idx, self.y + row_idx))
-        return cells
+        x = self.x
+        y = self.y
+        return [(x + dx, y + dy) for dx, dy in _cell_offsets(self.shape, self.rotation)]
 
     def rotate_cw(self) -> None:
         """Rotate clockwise."""
@@ -30,6 +30,11 @@ class TextInput:
         self.cursor_timer = 0
         self.cursor_blink_speed = 0.5  # seconds
 
+        # Cached rendered text surface; rebuilt only when the displayed
+        # string changes instead of on every frame
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_surface_key: Optional[tuple] = None
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame event.
 
@@ -96,11 +101,15 @@ class TextInput:
         pygame.draw.rect(surface, bg_color, self.rect)
         pygame.draw.rect(surface, border_color, self.rect, 2)
 
-        # Draw text or placeholder
-        if self.text:
-            text_surface = self.font.render(self.text, True, COLOR_TEXT)
-        else:
-            text_surface = self.font.render(placeholder, True, (150, 150, 150))
+        # Draw text or placeholder (re-render only when the string changes)
+        key = (self.text, placeholder)
+        if key != self._text_surface_key:
+            if self.text:
+                self._text_surface = self.font.render(self.text, True, COLOR_TEXT)
+            else:
+                self._text_surface = self.font.render(placeholder, True, (150, 150, 150))
+            self._text_surface_key = key
+        text_surface = self._text_surface
 
         # Center text vertically
         text_rect = text_surface.get_rect()
@@ -1,8 +1,8 @@
 """Touch control system for mobile web version."""
 
 import pygame
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
 from .constants import WINDOW_WIDTH, WINDOW_HEIGHT
 
 
@@ -19,6 +19,10 @@ class TouchButton:
     color: Tuple[int, int, int]
     hover_color: Tuple[int, int, int]
     is_pressed: bool = False
+    # Fully rendered button art per pressed state, built on first draw so
+    # subsequent frames are one blit instead of rect fills + a font render
+    _surface_cache: Dict[tuple, pygame.Surface] = field(
+        default_factory=dict, repr=False, compare=False)
 
     def contains_point(self, x: int, y: int) -> bool:
         """Check if point is inside button bounds."""
@@ -27,18 +31,24 @@ class TouchButton:
 
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw button on screen."""
-        color = self.hover_color if self.is_pressed else self.color
+        key = (id(font), self.is_pressed)
+        surface = self._surface_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            rect = surface.get_rect()
+            color = self.hover_color if self.is_pressed else self.color
 
-        # Draw button background with rounded corners
-        rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(screen, color, rect, border_radius=10)
-        pygame.draw.rect(screen, (255, 255, 255), rect, width=2, border_radius=10)
+            # Button background with rounded corners
+            pygame.draw.rect(surface, color, rect, border_radius=10)
+            pygame.draw.rect(surface, (255, 255, 255), rect, width=2, border_radius=10)
 
-        # Draw icon/label
-        text_surface = font.render(self.icon, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(self.x + self.width // 2,
-                                                    self.y + self.height // 2))
-        screen.blit(text_surface, text_rect)
+            # Icon/label
+            text_surface = font.render(self.icon, True, (255, 255, 255))
+            surface.blit(text_surface, text_surface.get_rect(center=rect.center))
+
+            self._surface_cache[key] = surface
+
+        screen.blit(surface, (self.x, self.y))
 
 
 class TouchControlManager:
@@ -167,6 +177,9 @@ class TouchControlManager:
         self.left_pressed = False
         self.right_pressed = False
 
+        # Lazily built hint surface for the left/right zone highlights
+        self._hint_surface = None
+
         # Expanded game area bounds for easier touch control
         # Leave space below pause button
         pause_bottom = self.pause_button.y + self.pause_button.height
@@ -259,19 +272,25 @@ class TouchControlManager:
 
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw all touch controls."""
-        # Draw visual hint for left/right areas (semi-transparent)
-        hint_surface = pygame.Surface((self.window_width // 2,
-                                       self.game_area_bottom - self.game_area_top))
-        hint_surface.set_alpha(30)
-
-        if self.left_pressed:
-            hint_surface.fill((100, 150, 255))
-            screen.blit(hint_surface, (0, self.game_area_top))
-
-        if self.right_pressed:
-            hint_surface.fill((255, 150, 100))
-            screen.blit(hint_surface, (self.window_width // 2, self.game_area_top))
-
-        # Draw buttons
+        # Draw visual hint for left/right areas (semi-transparent); the
+        # hint surface is allocated once and refilled only when shown
+        if self.left_pressed or self.right_pressed:
+            hint_surface = self._hint_surface
+            if hint_surface is None:
+                hint_surface = pygame.Surface(
+                    (self.window_width // 2,
+                     self.game_area_bottom - self.game_area_top))
+                hint_surface.set_alpha(30)
+                self._hint_surface = hint_surface
+
+            if self.left_pressed:
+                hint_surface.fill((100, 150, 255))
+                screen.blit(hint_surface, (0, self.game_area_top))
+
+            if self.right_pressed:
+                hint_surface.fill((255, 150, 100))
+                screen.blit(hint_surface, (self.window_width // 2, self.game_area_top))
+
+        # Draw buttons (each is a single cached blit)
         for button in self.buttons:
             button.draw(screen, font)